@@ -10,17 +10,24 @@ For quick basic statistics without full package installation, use `quick_analysi
 
 Usage:
     python3 scripts/analyze_dataset.py <midi_directory> [--output output.json] [--verbose]
+        [--workers N] [--ndjson-out metrics.ndjson]
 
 This script analyzes all MIDI files in a directory and aggregates statistics to inform
 prompt engineering decisions and composition analysis.
 """
 
 import json
+import os
 import statistics
 import sys
 from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from functools import partial, reduce
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 # Add src to path for standalone execution
 project_root = Path(__file__).parent
@@ -28,19 +35,150 @@ src_path = project_root / "src"
 if src_path.exists() and str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-try:
-    from pianist.composition_metrics import (
-        CompositionMetrics,
-        analyze_composition_metrics,
+if TYPE_CHECKING:
+    from pianist.composition_metrics import CompositionMetrics
+
+DURATION_BUCKET_LABELS = ("short_<64_beats", "medium_64-200_beats", "long_>=200_beats")
+MIDI_EXTENSIONS = frozenset({".mid", ".midi"})
+
+
+class Moments(NamedTuple):
+    """Streaming summary (count, mean, sum of squared deviations, min, max)."""
+
+    count: int
+    mean: float
+    m2: float
+    min: float
+    max: float
+
+    @classmethod
+    def of(cls, values: tuple[float, ...]) -> "Moments | None":
+        """Summarize values with Welford's algorithm (None when empty)."""
+        if not values:
+            return None
+        count, mean, m2 = 0, 0.0, 0.0
+        for x in values:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        return cls(count, mean, m2, min(values), max(values))
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation."""
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+
+def merge_moments(a: Moments, b: Moments) -> Moments:
+    """Combine two partial summaries (Chan et al. parallel algorithm)."""
+    n = a.count + b.count
+    delta = b.mean - a.mean
+    return Moments(
+        count=n,
+        mean=a.mean + delta * b.count / n,
+        m2=a.m2 + b.m2 + delta * delta * a.count * b.count / n,
+        min=min(a.min, b.min),
+        max=max(a.max, b.max),
     )
-except ImportError:
-    # Fallback if import fails
-    print("Error: Could not import composition_metrics module.")
-    print("Please ensure dependencies are installed: pip install pydantic mido")
-    sys.exit(1)
 
 
-def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
+def _pooled_moments(parts: list[Moments | None]) -> Moments | None:
+    present = [p for p in parts if p is not None]
+    return reduce(merge_moments, present) if present else None
+
+
+@dataclass(slots=True)
+class AggInput:
+    """The subset of CompositionMetrics that aggregate_metrics consumes.
+
+    Plain slotted dataclass so results pickle cheaply across the process-pool
+    boundary (Pydantic models re-validate on unpickle).
+    """
+
+    duration_beats: float
+    motif_frequency_per_64_beats: float | None
+    motif_median: float | None
+    max_gap_beats: float | None
+    mean_gap_beats: float | None
+    gaps_between_sections: tuple[float, ...]
+    section_transitions: tuple[float, ...]
+    rhythmic_entropy: float | None
+    melodic_entropy: float | None
+    phrase_length_variance: float | None
+    phrase_lengths: tuple[float, ...]
+    section_count: int
+    # Per-file partial moments, merged in the parent for mean/std/min/max
+    section_gap_moments: Moments | None = None
+    transition_moments: Moments | None = None
+    phrase_length_moments: Moments | None = None
+
+    @classmethod
+    def from_metrics(cls, m: "CompositionMetrics") -> "AggInput":
+        gaps = m.gap_analysis
+        variation = m.variation_metrics
+        interval = m.motif_repetition_interval_beats
+        section_gaps = tuple(gaps.gaps_between_sections) if gaps else ()
+        transitions = tuple(m.section_transitions)
+        phrase_lengths = tuple(m.phrase_lengths)
+        return cls(
+            duration_beats=m.duration_beats,
+            motif_frequency_per_64_beats=m.motif_frequency_per_64_beats,
+            motif_median=interval.median if interval else None,
+            max_gap_beats=gaps.max_gap_beats if gaps else None,
+            mean_gap_beats=gaps.mean_gap_beats if gaps else None,
+            gaps_between_sections=section_gaps,
+            section_transitions=transitions,
+            rhythmic_entropy=variation.rhythmic_entropy if variation else None,
+            melodic_entropy=variation.melodic_entropy if variation else None,
+            phrase_length_variance=variation.phrase_length_variance if variation else None,
+            phrase_lengths=phrase_lengths,
+            section_count=m.section_count,
+            section_gap_moments=Moments.of(section_gaps),
+            transition_moments=Moments.of(transitions),
+            phrase_length_moments=Moments.of(phrase_lengths),
+        )
+
+
+def _analyze_one(midi_file: Path, dump_json: bool = False) -> tuple[AggInput, bytes | None]:
+    """Analyze one MIDI file (runs in a worker process when --workers > 1).
+
+    When dump_json is set, the full metrics are also returned serialized as JSON
+    so the parent can stream them without re-pickling the Pydantic model.
+    """
+    from pianist.composition_metrics import analyze_composition_metrics
+
+    metrics = analyze_composition_metrics(midi_file)
+    raw_json = metrics.model_dump_json().encode() if dump_json else None
+    return AggInput.from_metrics(metrics), raw_json
+
+
+def _analyze_or_error(
+    midi_file: Path, dump_json: bool = False
+) -> tuple[AggInput | None, bytes | None, str | None]:
+    try:
+        return *_analyze_one(midi_file, dump_json), None
+    except Exception as e:
+        return None, None, str(e)
+
+
+def _iter_analyses(
+    midi_files: list[Path], workers: int, dump_json: bool = False
+) -> Iterator[tuple[Path, AggInput | None, bytes | None, str | None]]:
+    """Yield (path, result, raw_json, error) for each file, in input order."""
+    analyze = partial(_analyze_or_error, dump_json=dump_json)
+    if workers <= 1:
+        for midi_file in midi_files:
+            yield midi_file, *analyze(midi_file)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(analyze, midi_files)
+        for midi_file, result in zip(midi_files, results, strict=True):
+            yield midi_file, *result
+
+
+def aggregate_metrics(metrics_list: list[AggInput]) -> dict[str, Any]:
     """Aggregate metrics across multiple compositions."""
     if not metrics_list:
         return {}
@@ -77,12 +215,7 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
         }
 
     # Motif repetition intervals
-    all_intervals: list[float] = []
-    for m in valid_metrics:
-        if m.motif_repetition_interval_beats:
-            dist = m.motif_repetition_interval_beats
-            if dist.median:
-                all_intervals.append(dist.median)
+    all_intervals = [m.motif_median for m in valid_metrics if m.motif_median]
 
     if all_intervals:
         aggregated["motif_repetition_interval"] = {
@@ -93,12 +226,11 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
         }
 
     # Gap analysis
-    max_gaps = [m.gap_analysis.max_gap_beats for m in valid_metrics if m.gap_analysis]
-    mean_gaps = [m.gap_analysis.mean_gap_beats for m in valid_metrics if m.gap_analysis]
-    section_gaps = []
+    max_gaps = [m.max_gap_beats for m in valid_metrics if m.max_gap_beats is not None]
+    mean_gaps = [m.mean_gap_beats for m in valid_metrics if m.mean_gap_beats is not None]
+    section_gaps: list[float] = []
     for m in valid_metrics:
-        if m.gap_analysis:
-            section_gaps.extend(m.gap_analysis.gaps_between_sections)
+        section_gaps.extend(m.gaps_between_sections)
 
     if max_gaps:
         aggregated["gaps"] = {
@@ -108,12 +240,14 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
             "mean_gap_median": float(statistics.median(mean_gaps)),
         }
 
-    if section_gaps:
+    gap_moments = _pooled_moments([m.section_gap_moments for m in valid_metrics])
+    if section_gaps and gap_moments:
         aggregated["section_gaps"] = {
-            "mean": float(statistics.mean(section_gaps)),
+            "mean": gap_moments.mean,
+            "std": gap_moments.std,
             "median": float(statistics.median(section_gaps)),
-            "min": float(min(section_gaps)),
-            "max": float(max(section_gaps)),
+            "min": gap_moments.min,
+            "max": gap_moments.max,
             "p95": float(statistics.quantiles(section_gaps, n=20)[18])
             if len(section_gaps) >= 20
             else None,
@@ -124,12 +258,14 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
     for m in valid_metrics:
         all_transitions.extend(m.section_transitions)
 
-    if all_transitions:
+    transition_moments = _pooled_moments([m.transition_moments for m in valid_metrics])
+    if all_transitions and transition_moments:
         aggregated["transition_lengths"] = {
-            "mean": float(statistics.mean(all_transitions)),
+            "mean": transition_moments.mean,
+            "std": transition_moments.std,
             "median": float(statistics.median(all_transitions)),
-            "min": float(min(all_transitions)),
-            "max": float(max(all_transitions)),
+            "min": transition_moments.min,
+            "max": transition_moments.max,
             "p25": float(statistics.quantiles(all_transitions, n=4)[0])
             if len(all_transitions) >= 4
             else None,
@@ -140,13 +276,11 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
 
     # Variation metrics
     rhythmic_entropies = [
-        m.variation_metrics.rhythmic_entropy for m in valid_metrics if m.variation_metrics
-    ]
-    melodic_entropies = [
-        m.variation_metrics.melodic_entropy for m in valid_metrics if m.variation_metrics
+        m.rhythmic_entropy for m in valid_metrics if m.rhythmic_entropy is not None
     ]
+    melodic_entropies = [m.melodic_entropy for m in valid_metrics if m.melodic_entropy is not None]
     phrase_variances = [
-        m.variation_metrics.phrase_length_variance for m in valid_metrics if m.variation_metrics
+        m.phrase_length_variance for m in valid_metrics if m.phrase_length_variance is not None
     ]
 
     if rhythmic_entropies:
@@ -174,12 +308,14 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
     for m in valid_metrics:
         all_phrase_lengths.extend(m.phrase_lengths)
 
-    if all_phrase_lengths:
+    phrase_moments = _pooled_moments([m.phrase_length_moments for m in valid_metrics])
+    if all_phrase_lengths and phrase_moments:
         aggregated["phrase_lengths"] = {
-            "mean": float(statistics.mean(all_phrase_lengths)),
+            "mean": phrase_moments.mean,
+            "std": phrase_moments.std,
             "median": float(statistics.median(all_phrase_lengths)),
-            "min": float(min(all_phrase_lengths)),
-            "max": float(max(all_phrase_lengths)),
+            "min": phrase_moments.min,
+            "max": phrase_moments.max,
             "common_lengths": dict(
                 Counter(round(pl, 1) for pl in all_phrase_lengths).most_common(10)
             ),
@@ -193,48 +329,43 @@ def aggregate_metrics(metrics_list: list[CompositionMetrics]) -> dict[str, Any]:
             "median_per_composition": float(statistics.median(section_counts)),
         }
 
-    # Duration-based analysis
-    short_pieces = [m for m in valid_metrics if m.duration_beats < 64]
-    medium_pieces = [m for m in valid_metrics if 64 <= m.duration_beats < 200]
-    long_pieces = [m for m in valid_metrics if m.duration_beats >= 200]
-
-    if short_pieces:
-        short_motif_freqs = [
-            m.motif_frequency_per_64_beats for m in short_pieces if m.motif_frequency_per_64_beats
-        ]
-        if short_motif_freqs:
-            aggregated["by_duration"] = {
-                "short_<64_beats": {
-                    "count": len(short_pieces),
-                    "motif_frequency_mean": float(statistics.mean(short_motif_freqs)),
-                },
+    # Duration-based analysis (one pass: bucket each piece by duration); numpy is
+    # imported here so --help and argument errors don't load it
+    import numpy as np
+
+    durations = np.fromiter((m.duration_beats for m in valid_metrics), dtype=float)
+    motif_freqs = np.fromiter(
+        (
+            m.motif_frequency_per_64_beats if m.motif_frequency_per_64_beats is not None else np.nan
+            for m in valid_metrics
+        ),
+        dtype=float,
+    )
+    buckets = np.searchsorted([64.0, 200.0], durations, side="right")
+    has_motifs = motif_freqs > 0  # NaN compares False, so missing values drop out
+    by_duration: dict[str, Any] = {}
+    for b, label in enumerate(DURATION_BUCKET_LABELS):
+        in_bucket = buckets == b
+        bucket_freqs = motif_freqs[in_bucket & has_motifs]
+        if bucket_freqs.size:
+            by_duration[label] = {
+                "count": int(in_bucket.sum()),
+                "motif_frequency_mean": float(bucket_freqs.mean()),
             }
+    if by_duration:
+        aggregated["by_duration"] = by_duration
 
-    if medium_pieces:
-        medium_motif_freqs = [
-            m.motif_frequency_per_64_beats for m in medium_pieces if m.motif_frequency_per_64_beats
-        ]
-        if medium_motif_freqs:
-            if "by_duration" not in aggregated:
-                aggregated["by_duration"] = {}
-            aggregated["by_duration"]["medium_64-200_beats"] = {
-                "count": len(medium_pieces),
-                "motif_frequency_mean": float(statistics.mean(medium_motif_freqs)),
-            }
+    return aggregated
 
-    if long_pieces:
-        long_motif_freqs = [
-            m.motif_frequency_per_64_beats for m in long_pieces if m.motif_frequency_per_64_beats
-        ]
-        if long_motif_freqs:
-            if "by_duration" not in aggregated:
-                aggregated["by_duration"] = {}
-            aggregated["by_duration"]["long_>=200_beats"] = {
-                "count": len(long_pieces),
-                "motif_frequency_mean": float(statistics.mean(long_motif_freqs)),
-            }
 
-    return aggregated
+def find_midi_files(midi_dir: Path) -> list[Path]:
+    """List .mid/.midi files (any case) in a directory with a single scan."""
+    with os.scandir(midi_dir) as entries:
+        return [
+            Path(e.path)
+            for e in entries
+            if os.path.splitext(e.name)[1].lower() in MIDI_EXTENSIONS and e.is_file()
+        ]
 
 
 def main():
@@ -259,6 +390,18 @@ def main():
         action="store_true",
         help="Print progress information",
     )
+    parser.add_argument(
+        "--ndjson-out",
+        type=str,
+        default=None,
+        help="Also write per-file metrics as newline-delimited JSON, as each file completes",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for analysis (default: 1, in-process)",
+    )
 
     args = parser.parse_args()
 
@@ -268,29 +411,47 @@ def main():
         return 1
 
     # Find all MIDI files
-    midi_files = list(midi_dir.glob("*.mid")) + list(midi_dir.glob("*.midi"))
+    midi_files = find_midi_files(midi_dir)
 
     if not midi_files:
         print(f"Error: No MIDI files found in {midi_dir}")
         return 1
 
+    # Deferred so --help and argument errors don't pay for the analysis stack
+    try:
+        import pianist.composition_metrics  # noqa: F401
+    except ImportError:
+        print("Error: Could not import composition_metrics module.")
+        print("Please ensure dependencies are installed: pip install pydantic mido")
+        return 1
+
     print(f"Found {len(midi_files)} MIDI files")
 
     # Analyze each file
-    all_metrics: list[CompositionMetrics] = []
+    all_metrics: list[AggInput] = []
     errors: list[tuple[str, str]] = []
 
-    for i, midi_file in enumerate(midi_files, 1):
-        if args.verbose:
-            print(f"Analyzing {i}/{len(midi_files)}: {midi_file.name}")
+    with ExitStack() as stack:
+        ndjson_fh = None
+        if args.ndjson_out:
+            ndjson_fh = stack.enter_context(open(args.ndjson_out, "wb"))
 
-        try:
-            metrics = analyze_composition_metrics(midi_file)
-            all_metrics.append(metrics)
-        except Exception as e:
-            errors.append((str(midi_file), str(e)))
+        results = _iter_analyses(midi_files, args.workers, dump_json=ndjson_fh is not None)
+        for i, (midi_file, metrics, raw_json, error) in enumerate(results, 1):
             if args.verbose:
-                print(f"  Error: {e}")
+                print(f"Analyzed {i}/{len(midi_files)}: {midi_file.name}")
+
+            if metrics is not None:
+                all_metrics.append(metrics)
+                if ndjson_fh and raw_json is not None:
+                    ndjson_fh.write(raw_json)
+                    ndjson_fh.write(b"\n")
+                    if i % 100 == 0:
+                        ndjson_fh.flush()
+            else:
+                errors.append((str(midi_file), str(error)))
+                if args.verbose:
+                    print(f"  Error: {error}")
 
     if errors:
         print(f"\n{len(errors)} files had errors:")
@@ -306,7 +467,7 @@ def main():
     # Save results
     output_path = Path(args.output)
     with open(output_path, "w") as f:
-        json.dump(aggregated, f, indent=2)
+        f.write(json.dumps(aggregated, indent=2))
 
     print(f"\nResults saved to {output_path}")
     print("\nSummary:")
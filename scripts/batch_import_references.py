@@ -22,16 +22,81 @@ from __future__ import annotations
 
 import argparse
 import csv
+import fnmatch
+import importlib.util
+import os
+import queue
 import sys
+import threading
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from pianist.iterate import composition_from_midi
-from pianist.parser import parse_composition_from_text
-from pianist.reference_db import MusicalReference, get_default_database
+from typing import TYPE_CHECKING, Any
+
+# Add src to path unless pianist is installed (pip install -e .), in which case
+# the import system already finds it and sys.path is left alone
+if importlib.util.find_spec("pianist") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+DEFAULT_BATCH_SIZE = 200
+CSV_READ_BUFFER = 1 << 20
+READ_AHEAD_PER_WORKER = 2
+# Enhanced MusicalReference fields that may be supplied by metadata (review script output)
+ENHANCED_FIELDS = (
+    "detected_key",
+    "tempo_bpm",
+    "duration_beats",
+    "quality_score",
+    "technical_score",
+    "musical_score",
+    "structure_score",
+    "motif_count",
+    "phrase_count",
+    "chord_count",
+    "harmonic_progression",
+    "time_signature",
+    "bars",
+)
+# Maps spaces and hyphens to underscores when deriving reference IDs, in one pass
+_ID_TABLE = str.maketrans({" ": "_", "-": "_"})
+REFERENCE_EXTENSIONS = frozenset({".json", ".mid", ".midi"})
+
+if TYPE_CHECKING:
+    from collections.abc import Container, Iterator
+
+    from pianist.reference_db import MusicalReference, ReferenceDatabase
+
+# pianist modules are imported where they are first needed so --help, argument
+# errors and dry runs don't pay for loading the composition/analysis stack.
+
+
+def _coerce(value: str | None) -> str | None:
+    """Strip a metadata text value, mapping empty/missing values to None."""
+    return (value.strip() or None) if value else None
+
+
+def _intern_text(value: str | None) -> str | None:
+    """Coerce a categorical value (style/form) and intern it so repeated rows share one string."""
+    value = _coerce(value)
+    return sys.intern(value) if value is not None else None
+
+
+def _split_techniques(value: str | None) -> list[str] | None:
+    """Split a comma-separated techniques value, dropping empty entries."""
+    raw = _coerce(value)
+    if raw is None:
+        return None
+    if "," not in raw:
+        return [sys.intern(raw)]
+    return [sys.intern(t) for t in (t.strip() for t in raw.split(",")) if t] or None
 
 
 def parse_metadata_csv(csv_path: Path) -> dict[str, dict[str, Any]]:
@@ -56,78 +121,175 @@ def parse_metadata_csv(csv_path: Path) -> dict[str, dict[str, Any]]:
     metadata: dict[str, dict[str, Any]] = {}
 
     def safe_float(value: Any, default: float | None = None) -> float | None:
-        if value == "" or value is None:
-            return default
         try:
             return float(value)
         except (ValueError, TypeError):
             return default
 
     def safe_int(value: Any, default: int | None = None) -> int | None:
-        if value == "" or value is None:
-            return default
         try:
             return int(float(value))
         except (ValueError, TypeError):
             return default
 
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    # Enhanced metadata columns (from review script): key -> converter
+    enhanced_columns: dict[str, Any] = {
+        "detected_key": _coerce,
+        "tempo_bpm": safe_float,
+        "duration_beats": safe_float,
+        "quality_score": safe_float,
+        "technical_score": safe_float,
+        "musical_score": safe_float,
+        "structure_score": safe_float,
+        "motif_count": safe_int,
+        "phrase_count": safe_int,
+        "chord_count": safe_int,
+        "time_signature": _coerce,
+        "bars": safe_float,
+    }
+
+    with open(csv_path, encoding="utf-8", newline="", buffering=CSV_READ_BUFFER) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return metadata
+        col = {name: i for i, name in enumerate(header)}
+
+        def cell(row: list[str], i: int | None) -> str:
+            return row[i] if i is not None and i < len(row) else ""
+
+        i_filename = col.get("filename")
+        i_id = col.get("id")
+        i_title = col.get("title")
+        i_description = col.get("description")
+        i_style = col.get("style")
+        i_form = col.get("form")
+        i_techniques = col.get("techniques")
+        i_progression = col.get("harmonic_progression")
+        enhanced = [
+            (key, col[key], convert) for key, convert in enhanced_columns.items() if key in col
+        ]
+
         for row in reader:
-            filename = row.get("filename", "").strip()
+            filename = cell(row, i_filename).strip()
             if not filename:
                 continue
 
-            # Parse techniques if present
-            techniques = None
-            if row.get("techniques"):
-                techniques = [t.strip() for t in row["techniques"].split(",") if t.strip()]
-
             # Basic metadata
-            meta = {
-                "id": row.get("id", "").strip() or None,
-                "title": row.get("title", "").strip() or None,
-                "description": row.get("description", "").strip() or "",
-                "style": row.get("style", "").strip() or None,
-                "form": row.get("form", "").strip() or None,
-                "techniques": techniques,
+            meta: dict[str, Any] = {
+                "id": _coerce(cell(row, i_id)),
+                "title": _coerce(cell(row, i_title)),
+                "description": cell(row, i_description).strip(),
+                "style": _intern_text(cell(row, i_style)),
+                "form": _intern_text(cell(row, i_form)),
+                "techniques": _split_techniques(cell(row, i_techniques)),
             }
 
-            # Enhanced metadata (from review script)
-            if "detected_key" in row:
-                meta["detected_key"] = row.get("detected_key", "").strip() or None
-            if "tempo_bpm" in row:
-                meta["tempo_bpm"] = safe_float(row.get("tempo_bpm"))
-            if "duration_beats" in row:
-                meta["duration_beats"] = safe_float(row.get("duration_beats"))
-            if "quality_score" in row:
-                meta["quality_score"] = safe_float(row.get("quality_score"))
-            if "technical_score" in row:
-                meta["technical_score"] = safe_float(row.get("technical_score"))
-            if "musical_score" in row:
-                meta["musical_score"] = safe_float(row.get("musical_score"))
-            if "structure_score" in row:
-                meta["structure_score"] = safe_float(row.get("structure_score"))
-            if "motif_count" in row:
-                meta["motif_count"] = safe_int(row.get("motif_count"))
-            if "phrase_count" in row:
-                meta["phrase_count"] = safe_int(row.get("phrase_count"))
-            if "chord_count" in row:
-                meta["chord_count"] = safe_int(row.get("chord_count"))
-            if "harmonic_progression" in row:
-                prog = row.get("harmonic_progression", "").strip()
+            # Enhanced metadata (only for columns present in the header)
+            for key, i, convert in enhanced:
+                meta[key] = convert(cell(row, i))
+            if i_progression is not None:
+                prog = cell(row, i_progression).strip()
                 if prog:
                     meta["harmonic_progression"] = " ".join(prog.split()[:10])
-            if "time_signature" in row:
-                meta["time_signature"] = row.get("time_signature", "").strip() or None
-            if "bars" in row:
-                meta["bars"] = safe_float(row.get("bars"))
 
             metadata[filename] = meta
 
     return metadata
 
 
+def build_reference(
+    file_path: Path,
+    metadata: dict[str, Any] | None = None,
+    verbose: bool = False,
+    data: bytes | None = None,
+) -> MusicalReference:
+    """
+    Load a reference file and build its MusicalReference (without storing it).
+
+    Args:
+        file_path: Path to JSON or MIDI file
+        metadata: Optional metadata dict (id, title, description, style, form, techniques)
+        verbose: Print verbose output
+        data: File contents if already read (skips reading file_path)
+
+    Returns:
+        The reference ready to be added to the database
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    from pianist.reference_db import MusicalReference
+
+    # Resolve the name parts once; pathlib recomputes them on every attribute access
+    name = file_path.name
+    stem, suffix = os.path.splitext(name)
+    suffix = suffix.lower()
+
+    # Determine file type and load composition
+
+    if suffix in (".mid", ".midi"):
+        # Import MIDI file
+        if verbose:
+            print(f"  Importing MIDI: {name}")
+        from pianist.iterate import composition_from_midi
+
+        comp = composition_from_midi(file_path, data)
+    elif suffix == ".json":
+        # Load JSON file
+        if verbose:
+            print(f"  Loading JSON: {name}")
+        from pianist.parser import parse_composition_from_bytes
+
+        comp = parse_composition_from_bytes(data if data is not None else file_path.read_bytes())
+    else:
+        raise ValueError(f"Unsupported file type: {suffix}")
+
+    # Metadata values are already coerced (empty -> None) by the CSV and CLI paths
+    meta = metadata or {}
+
+    ref_id = meta.get("id")
+    if not ref_id:
+        ref_id = (comp.title or stem).translate(_ID_TABLE).lower()
+
+    return MusicalReference(
+        id=ref_id,
+        title=meta.get("title") or comp.title or stem,
+        description=meta.get("description") or "",
+        composition=comp,
+        style=meta.get("style"),
+        form=meta.get("form"),
+        techniques=meta.get("techniques"),
+        metadata=None,
+        **{key: meta.get(key) for key in ENHANCED_FIELDS},
+    )
+
+
+def _try_build_reference(
+    file_path: Path,
+    metadata: dict[str, Any] | None,
+    verbose: bool,
+    data: bytes | None = None,
+) -> tuple[MusicalReference | None, str]:
+    """Build a reference, returning (None, error message) instead of raising."""
+    try:
+        return build_reference(file_path, metadata, verbose, data), ""
+    except Exception as e:
+        return None, f"✗ Error importing {file_path.name}: {e}"
+
+
+@lru_cache(maxsize=1)
+def _default_database() -> ReferenceDatabase:
+    """Open the default reference database once per run and share it between callers."""
+    from pianist.reference_db import get_default_database
+
+    return get_default_database()
+
+
+def _added_message(reference: MusicalReference) -> str:
+    return f"✓ Added: {reference.id} - {reference.title}"
+
+
 def import_reference(
     file_path: Path,
     metadata: dict[str, Any] | None = None,
@@ -147,74 +309,146 @@ def import_reference(
         Tuple of (success: bool, message: str)
     """
     if ref_db is None:
-        ref_db = get_default_database()
+        ref_db = _default_database()
+
+    reference, error = _try_build_reference(file_path, metadata, verbose)
+    if reference is None:
+        return False, error
+
+    try:
+        ref_db.add_reference(reference)
+    except Exception as e:
+        return False, f"✗ Error importing {file_path.name}: {e}"
+
+    return True, _added_message(reference)
+
+
+def _flush_batch(
+    ref_db: Any, pending: list[MusicalReference], *, quiet: bool = False
+) -> tuple[int, int]:
+    """Write pending references in one transaction and report them with a single write.
+
+    If the transaction fails, the batch is retried one reference at a time so
+    only the references that actually fail are reported (by ID) and counted.
 
+    Returns:
+        Tuple of (successful_count, failed_count) for the batch
+    """
+    if not pending:
+        return 0, 0
+    batch = pending[:]
+    pending.clear()
     try:
-        # Determine file type and load composition
-        suffix = file_path.suffix.lower()
-
-        if suffix in (".mid", ".midi"):
-            # Import MIDI file
-            if verbose:
-                print(f"  Importing MIDI: {file_path.name}")
-            comp = composition_from_midi(file_path)
-        elif suffix == ".json":
-            # Load JSON file
-            if verbose:
-                print(f"  Loading JSON: {file_path.name}")
-            text = file_path.read_text(encoding="utf-8")
-            comp = parse_composition_from_text(text)
+        ref_db.add_references_bulk(batch)
+    except Exception:
+        added: list[MusicalReference] = []
+        lines = []
+        for reference in batch:
+            try:
+                ref_db.add_reference(reference)
+            except Exception as e:
+                lines.append(f"✗ Error importing {reference.id}: {e}")
+            else:
+                added.append(reference)
+                if not quiet:
+                    lines.append(_added_message(reference))
+        if lines:
+            print("\n".join(lines))
+        return len(added), len(batch) - len(added)
+    if not quiet:
+        print("\n".join(_added_message(reference) for reference in batch))
+    return len(batch), 0
+
+
+def _read_ahead(paths: list[Path], depth: int) -> Iterator[tuple[Path, bytes | None]]:
+    """
+    Read files on a background thread, staying at most ``depth`` files ahead.
+
+    Disk reads overlap with parsing of earlier files while the bounded queue caps
+    how many file contents are held in memory. Unreadable files yield ``None``
+    so the parse step reports the error.
+    """
+    buffer: queue.Queue[tuple[Path, bytes | None] | None] = queue.Queue(maxsize=depth)
+
+    def produce() -> None:
+        for path in paths:
+            try:
+                data: bytes | None = path.read_bytes()
+            except OSError:
+                data = None
+            buffer.put((path, data))
+        buffer.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (item := buffer.get()) is not None:
+        yield item
+
+
+def _parse_windowed(
+    executor: ThreadPoolExecutor,
+    files: Iterator[tuple[Path, bytes | None]],
+    metadata_map: dict[str, dict[str, Any]],
+    verbose: bool,
+    *,
+    window: int,
+    ordered: bool,
+) -> Iterator[tuple[MusicalReference | None, str]]:
+    """
+    Parse prefetched files on the executor, keeping at most ``window`` in flight.
+
+    Results are yielded in input order when ``ordered`` is set, otherwise as they
+    complete.
+    """
+    in_flight: deque[Future[tuple[MusicalReference | None, str]]] = deque()
+    for file_path, data in files:
+        metadata = metadata_map.get(file_path.name) if metadata_map else None
+        in_flight.append(executor.submit(_try_build_reference, file_path, metadata, verbose, data))
+        if len(in_flight) < window:
+            continue
+        if ordered:
+            yield in_flight.popleft().result()
         else:
-            return False, f"Unsupported file type: {suffix}"
-
-        # Extract basic metadata
-        ref_id = metadata.get("id") if metadata else None
-        if not ref_id:
-            ref_id = (comp.title or file_path.stem).lower().replace(" ", "_").replace("-", "_")
-
-        title = metadata.get("title") if metadata else comp.title or file_path.stem
-        description = metadata.get("description", "")
-        style = metadata.get("style") if metadata else None
-        form = metadata.get("form") if metadata else None
-        techniques = metadata.get("techniques") if metadata else None
-
-        # Extract enhanced metadata fields
-        enhanced_fields = {
-            "detected_key": metadata.get("detected_key") if metadata else None,
-            "tempo_bpm": metadata.get("tempo_bpm") if metadata else None,
-            "duration_beats": metadata.get("duration_beats") if metadata else None,
-            "quality_score": metadata.get("quality_score") if metadata else None,
-            "technical_score": metadata.get("technical_score") if metadata else None,
-            "musical_score": metadata.get("musical_score") if metadata else None,
-            "structure_score": metadata.get("structure_score") if metadata else None,
-            "motif_count": metadata.get("motif_count") if metadata else None,
-            "phrase_count": metadata.get("phrase_count") if metadata else None,
-            "chord_count": metadata.get("chord_count") if metadata else None,
-            "harmonic_progression": metadata.get("harmonic_progression") if metadata else None,
-            "time_signature": metadata.get("time_signature") if metadata else None,
-            "bars": metadata.get("bars") if metadata else None,
-        }
-
-        # Create reference
-        reference = MusicalReference(
-            id=ref_id,
-            title=title,
-            description=description,
-            composition=comp,
-            style=style,
-            form=form,
-            techniques=techniques,
-            metadata=None,
-            **enhanced_fields,
-        )
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.remove(future)
+                yield future.result()
 
-        # Add to database
-        ref_db.add_reference(reference)
+    for future in in_flight if ordered else as_completed(in_flight):
+        yield future.result()
 
-        return True, f"✓ Added: {ref_id} - {title}"
 
-    except Exception as e:
-        return False, f"✗ Error importing {file_path.name}: {e}"
+def find_reference_files(
+    dir_path: Path,
+    pattern: str = "*",
+    *,
+    limit: int | None = None,
+    names: Container[str] | None = None,
+) -> list[Path]:
+    """
+    List importable files (.json, .mid, .midi) in a directory with one os.scandir pass.
+
+    The pattern is matched against the file name without its extension (so "*"
+    matches everything, like the "<pattern>.json" globs this replaces) or against
+    the full name (so "*.json" also works). Extensions match case-insensitively.
+    If ``limit`` is given, the scan stops after that many matches (in directory order).
+    If ``names`` is given, only files whose name is in it are considered.
+    """
+    files: list[Path] = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if names is not None and entry.name not in names:
+                continue
+            stem, ext = os.path.splitext(entry.name)
+            if ext.lower() not in REFERENCE_EXTENSIONS:
+                continue
+            if not (fnmatch.fnmatch(stem, pattern) or fnmatch.fnmatch(entry.name, pattern)):
+                continue
+            # DirEntry caches the stat from the scan, so this costs no extra syscall
+            if entry.is_file(follow_symlinks=False):
+                files.append(Path(entry.path))
+                if limit is not None and len(files) >= limit:
+                    break
+    return files
 
 
 def import_from_directory(
@@ -223,21 +457,41 @@ def import_from_directory(
     pattern: str = "*",
     verbose: bool = False,
     dry_run: bool = False,
+    *,
+    ordered: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    ref_db: Any | None = None,
+    limit: int | None = None,
+    quiet: bool = False,
+    only_metadata: bool = False,
 ) -> tuple[int, int]:
     """
     Import all matching files from a directory.
 
+    Files are parsed concurrently; the resulting references are written to the
+    database in batches of ``batch_size``, one transaction per batch.
+
     Args:
         dir_path: Directory containing files to import
         metadata_csv: Optional CSV file with metadata
         pattern: Glob pattern for files (default: "*" matches all)
         verbose: Print verbose output
         dry_run: Don't actually import, just show what would be imported
+        ordered: Process and report files in sorted filename order
+        workers: Number of threads parsing files concurrently
+        batch_size: Number of references written per database transaction
+        ref_db: Reference database instance (uses the default database if None)
+        limit: Only import the first ``limit`` matching files (the first in sorted
+            order if ``ordered``, otherwise the scan stops early)
+        quiet: Don't print a line per imported file (failures are still reported)
+        only_metadata: Only import files that have a row in ``metadata_csv``
 
     Returns:
         Tuple of (successful_count, failed_count)
     """
-    ref_db = get_default_database() if not dry_run else None
+    if ref_db is None and not dry_run:
+        ref_db = _default_database()
 
     # Load metadata if provided
     metadata_map: dict[str, dict[str, Any]] = {}
@@ -246,10 +500,16 @@ def import_from_directory(
             print(f"Loading metadata from: {metadata_csv}")
         metadata_map = parse_metadata_csv(metadata_csv)
 
-    # Find all JSON and MIDI files
-    json_files = list(dir_path.glob(f"{pattern}.json"))
-    midi_files = list(dir_path.glob(f"{pattern}.mid")) + list(dir_path.glob(f"{pattern}.midi"))
-    all_files = json_files + midi_files
+    # Find all JSON and MIDI files in a single directory scan. Ordered runs need the
+    # full listing to pick the first files by name; otherwise stop scanning at the limit.
+    all_files = find_reference_files(
+        dir_path,
+        pattern,
+        limit=None if ordered else limit,
+        names=metadata_map.keys() if only_metadata else None,
+    )
+    if ordered:
+        all_files = sorted(all_files)[:limit]
 
     if not all_files:
         print(f"No matching files found in {dir_path}")
@@ -260,28 +520,45 @@ def import_from_directory(
         if dry_run:
             print("DRY RUN - No files will be imported")
 
+    if dry_run:
+        for file_path in all_files:
+            name = file_path.name
+            print(f"Would import: {name}")
+            metadata = metadata_map.get(name) if metadata_map else None
+            if metadata:
+                print(f"  Metadata: {metadata}")
+        return len(all_files), 0
+
     successful = 0
     failed = 0
 
-    for file_path in sorted(all_files):
-        # Get metadata for this file
-        filename = file_path.name
-        metadata = metadata_map.get(filename)
-
-        if dry_run:
-            print(f"Would import: {filename}")
-            if metadata:
-                print(f"  Metadata: {metadata}")
-            successful += 1
-        else:
-            success, message = import_reference(file_path, metadata, ref_db, verbose)
-            print(message)
-            if success:
-                successful += 1
-            else:
+    pending: list[MusicalReference] = []
+    batch_size = max(1, batch_size)
+
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        prefetched = _read_ahead(all_files, depth=READ_AHEAD_PER_WORKER * workers)
+        results = _parse_windowed(
+            executor,
+            prefetched,
+            metadata_map,
+            verbose,
+            window=READ_AHEAD_PER_WORKER * workers,
+            ordered=ordered,
+        )
+        for reference, error in results:
+            if reference is None:
+                print(error)
                 failed += 1
+                continue
+            pending.append(reference)
+            if len(pending) >= batch_size:
+                added, batch_failed = _flush_batch(ref_db, pending, quiet=quiet)
+                successful += added
+                failed += batch_failed
 
-    return successful, failed
+    added, batch_failed = _flush_batch(ref_db, pending, quiet=quiet)
+    return successful + added, failed + batch_failed
 
 
 def main() -> int:
@@ -373,11 +650,44 @@ Examples:
         action="store_true",
         help="Print verbose output",
     )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only report failures and the final summary, not every imported file",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Don't actually import, just show what would be imported",
     )
+    parser.add_argument(
+        "--ordered",
+        action="store_true",
+        help="Import and report files in sorted order (default: as they complete)",
+    )
+    parser.add_argument(
+        "--only-metadata",
+        action="store_true",
+        help="Only import files listed in the --metadata CSV",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="Only import the first N matching files (useful with --dry-run on large directories)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of files to import concurrently (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"References written per database transaction (default: {DEFAULT_BATCH_SIZE})",
+    )
 
     args = parser.parse_args()
 
@@ -394,27 +704,43 @@ Examples:
         print(f"Error: Metadata file not found: {args.metadata}", file=sys.stderr)
         return 1
 
+    if args.only_metadata and not args.metadata:
+        print("Error: --only-metadata requires --metadata", file=sys.stderr)
+        return 1
+
+    if args.limit is not None and args.limit < 1:
+        print("Error: --limit must be at least 1", file=sys.stderr)
+        return 1
+
+    # Open the database once and share it across the import and the final count
+    ref_db = None
+    if not args.dry_run:
+        ref_db = _default_database()
+
     # Import
     if args.file:
-        # Single file import
+        # Single file import (no metadata dict unless a metadata flag was given)
         metadata = None
-        if args.id or args.title or args.description or args.style or args.form or args.techniques:
-            techniques = None
-            if args.techniques:
-                techniques = [t.strip() for t in args.techniques.split(",") if t.strip()]
-
+        if any((args.id, args.title, args.description, args.style, args.form, args.techniques)):
             metadata = {
-                "id": args.id,
-                "title": args.title,
-                "description": args.description,
-                "style": args.style,
-                "form": args.form,
-                "techniques": techniques,
+                "id": _coerce(args.id),
+                "title": _coerce(args.title),
+                "description": args.description.strip(),
+                "style": _coerce(args.style),
+                "form": _coerce(args.form),
+                "techniques": _split_techniques(args.techniques),
             }
 
-        ref_db = get_default_database() if not args.dry_run else None
+        if args.dry_run:
+            print("DRY RUN - No files will be imported")
+            print(f"Would import: {args.file.name}")
+            if metadata:
+                print(f"  Metadata: {metadata}")
+            return 0
+
         success, message = import_reference(args.file, metadata, ref_db, args.verbose)
-        print(message)
+        if not (success and args.quiet):
+            print(message)
         return 0 if success else 1
 
     elif args.dir:
@@ -425,10 +751,16 @@ Examples:
             args.pattern,
             args.verbose,
             args.dry_run,
+            ordered=args.ordered,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            ref_db=ref_db,
+            limit=args.limit,
+            quiet=args.quiet,
+            only_metadata=args.only_metadata,
         )
 
-        if not args.dry_run:
-            ref_db = get_default_database()
+        if ref_db is not None:
             total = ref_db.count_references()
             print(f"\nImport complete: {successful} successful, {failed} failed")
             print(f"Total references in database: {total}")
@@ -17,26 +17,241 @@ Usage:
 
     # Check with AI assessment (always used)
     python3 scripts/check_midi_quality.py file.mid --provider gemini
+
+    # Stream one JSON report per line as files finish
+    python3 scripts/check_midi_quality.py --dir references/ --jsonl reports.jsonl
+
+    # Spread the CPU-bound analysis over 8 processes
+    python3 scripts/check_midi_quality.py --dir references/ --processes 8
+
+    # Assess 10 files per AI request
+    python3 scripts/check_midi_quality.py --dir references/ --ai-batch 10
+
+    # Re-use reports for files unchanged since the last run
+    python3 scripts/check_midi_quality.py --dir references/ --cache quality_cache.json
 """
 
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from pathlib import Path
+from typing import IO, Any, NamedTuple
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import mido
 
-from pianist.ai_providers import get_default_model
+# Add src to path unless pianist is installed (pip install -e .), in which case
+# the import system already finds it and sys.path is left alone
+if importlib.util.find_spec("pianist") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pianist.ai_providers import create_client, get_default_model
+from pianist.analyze import find_midi_files
 from pianist.config import get_ai_model, get_ai_provider
+from pianist.iterate import composition_from_midi
 from pianist.quality import (
     QualityReport,
     check_midi_file,
+    get_ai_assessments,
     print_report,
 )
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+DEFAULT_PATTERN = "*.mid"
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values found in report details that JSON encoders don't handle natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if hasattr(obj, "tolist"):  # numpy scalars and arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, *, indent: bool = False, newline: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=_json_default,
+                option=(orjson.OPT_INDENT_2 if indent else 0)
+                | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:
+            pass  # Types orjson doesn't handle; let the stdlib encoder try
+    text = json.dumps(obj, indent=2 if indent else None, default=_json_default)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def load_report_cache(path: Path) -> dict[str, Any]:
+    """Load a --cache file; a missing or unreadable cache starts empty."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    try:
+        cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    except ValueError:
+        print(f"Warning: Ignoring unreadable cache file: {path}", file=sys.stderr)
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _cache_options(
+    *, skip_musical: bool, provider: str, model: str, use_ai: bool
+) -> dict[str, Any]:
+    """The check options a cached report depends on besides the file itself."""
+    return {"skip_musical": skip_musical, "provider": provider, "model": model, "use_ai": use_ai}
+
+
+def cached_report(
+    cache: dict[str, Any],
+    file_path: Path,
+    *,
+    skip_musical: bool,
+    provider: str,
+    model: str,
+    use_ai: bool = True,
+) -> QualityReport | None:
+    """
+    Return the cached report for a file if its size and mtime are unchanged.
+
+    The report must also come from the same options, including the AI provider and
+    model, so switching either checks the file again.
+    """
+    entry = cache.get(str(file_path))
+    if entry is None:
+        return None
+    st = file_path.stat()
+    options = _cache_options(
+        skip_musical=skip_musical, provider=provider, model=model, use_ai=use_ai
+    )
+    if (
+        entry.get("size") != st.st_size
+        or entry.get("mtime_ns") != st.st_mtime_ns
+        or any(entry.get(key) != value for key, value in options.items())
+    ):
+        return None
+    return QualityReport.from_dict(entry["report"])
+
+
+def cache_report(
+    cache: dict[str, Any],
+    report: QualityReport,
+    *,
+    skip_musical: bool,
+    provider: str,
+    model: str,
+    use_ai: bool = True,
+) -> None:
+    """Record a report in the cache, keyed by the file's current size and mtime."""
+    # A failed AI assessment (e.g. provider offline) is retried on the next run
+    if use_ai and report.ai_assessment is None:
+        return
+    try:
+        st = report.file_path.stat()
+    except OSError:
+        return
+    cache[str(report.file_path)] = {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        **_cache_options(skip_musical=skip_musical, provider=provider, model=model, use_ai=use_ai),
+        "report": report.to_dict(),
+    }
+
+
+class ReportSummary(NamedTuple):
+    """The fields of a QualityReport kept in memory for the final summary."""
+
+    file_path: Path
+    overall_score: float
+
+
+class JsonReportWriter:
+    """
+    Write reports to disk as they complete instead of holding them all in memory.
+
+    In ``jsonl`` mode each report is one JSON line. Otherwise the legacy
+    ``{"files_checked": N, "reports": [...]}`` document is written incrementally,
+    with reports in completion order.
+    """
+
+    def __init__(self, stream: IO[bytes], files_checked: int, *, jsonl: bool) -> None:
+        self.stream = stream
+        self.jsonl = jsonl
+        self.count = 0
+        if not jsonl:
+            stream.write(b'{\n  "files_checked": %d,\n  "reports": [' % files_checked)
+
+    def write(self, report: QualityReport) -> None:
+        # Pieces go straight to the (buffered) stream rather than being joined first
+        if self.jsonl:
+            self.stream.write(dumps_json(report.to_dict(), newline=True))
+        else:
+            record = dumps_json(report.to_dict(), indent=True).replace(b"\n", b"\n    ")
+            self.stream.write(b",\n    " if self.count else b"\n    ")
+            self.stream.write(record)
+        self.count += 1
+
+    def finish(self) -> None:
+        if not self.jsonl:
+            self.stream.write(b"\n  ]\n}" if self.count else b"]\n}")
+
+
+# Per-process state for --processes workers (clients can't be pickled, so each
+# worker process creates its own in _init_worker)
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(provider: str) -> None:
+    _worker_state["client"] = create_client(provider)
+
+
+def _check_in_worker(
+    file_path: Path, provider: str, model: str, skip_musical: bool = False
+) -> QualityReport:
+    return check_midi_file(
+        file_path,
+        provider,
+        model,
+        client=_worker_state.get("client"),
+        skip_musical=skip_musical,
+    )
+
+
+def check_for_batch(file_path: Path, skip_musical: bool = False) -> tuple[QualityReport, Any]:
+    """
+    Run every check except the AI assessment, which --ai-batch requests later.
+
+    Returns the report and the composition the batched assessment needs, or None
+    if the file couldn't be converted (the report then already has its final form).
+    """
+    try:
+        midi = mido.MidiFile(file_path)
+        composition = composition_from_midi(file_path, midi=midi)
+    except Exception:
+        # Let check_midi_file record the failure exactly as it does without
+        # batching; the conversion fails again before any AI request is made
+        return check_midi_file(file_path, skip_musical=skip_musical), None
+    report = check_midi_file(
+        file_path, composition=composition, skip_musical=skip_musical, use_ai=False, midi=midi
+    )
+    return report, composition
+
 
 def main() -> int:
     """Main entry point."""
@@ -63,8 +278,8 @@ def main() -> int:
     parser.add_argument(
         "--pattern",
         type=str,
-        default="*.mid",
-        help="Glob pattern for files in directory (default: *.mid)",
+        default=DEFAULT_PATTERN,
+        help=f"Glob pattern for files in directory; *.midi files are always included (default: {DEFAULT_PATTERN})",
     )
     parser.add_argument(
         "--provider",
@@ -85,11 +300,49 @@ def main() -> int:
         action="store_true",
         help="Print detailed information",
     )
-    parser.add_argument(
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
         "--json",
         type=Path,
         help="Output results as JSON to file",
     )
+    output_group.add_argument(
+        "--jsonl",
+        type=Path,
+        help="Stream results to file as JSON Lines, one report per line as each file finishes",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of files to check concurrently; AI requests overlap (default: 8)",
+    )
+    parser.add_argument(
+        "--skip-musical",
+        action="store_true",
+        help="Skip the music21 musical checks (much faster; the musical score is not assessed "
+        "and the overall score is weighted over the technical and structure scores only)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Number of worker processes for the CPU-bound analysis; when above 1, "
+        "replaces the --concurrency threads (default: 1)",
+    )
+    parser.add_argument(
+        "--ai-batch",
+        type=int,
+        default=1,
+        help="Number of files to assess per AI request; above 1, the AI assessments "
+        "run after the other checks, one request per batch (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="JSON file of reports from earlier runs; files whose size and modification "
+        "time are unchanged reuse their cached report instead of being checked again",
+    )
     parser.add_argument(
         "--min-score",
         type=float,
@@ -110,23 +363,119 @@ def main() -> int:
         if not args.dir.is_dir():
             print(f"Error: Not a directory: {args.dir}", file=sys.stderr)
             return 1
-        files = list(args.dir.glob(args.pattern)) + list(args.dir.glob("*.midi"))
+        files = find_midi_files(args.dir, args.pattern)
         if not files:
             print(f"Error: No MIDI files found in {args.dir}", file=sys.stderr)
             return 1
 
-    # Check files
-    reports: list[QualityReport] = []
-    for file_path in sorted(files):
-        if args.verbose:
-            print(f"Checking: {file_path.name}...")
-        # Get provider and model from args or config
-        provider = args.provider or get_ai_provider()
-        model = args.model or get_ai_model(provider) or get_default_model(provider)
-
-        report = check_midi_file(file_path, provider, model)
-        reports.append(report)
+    # Get provider and model from args or config
+    provider = args.provider or get_ai_provider()
+    model = args.model or get_ai_model(provider) or get_default_model(provider)
+
+    # Threads overlap the AI round-trips; processes also spread the analysis over cores
+    use_processes = args.processes > 1
+    workers = max(1, args.concurrency)
+    ai_batch = max(1, args.ai_batch)
+    # One provider client shared by every thread, so AI requests reuse its connections.
+    # Batched assessments are always requested from this process.
+    client = (
+        create_client(provider, pool_size=workers) if ai_batch > 1 or not use_processes else None
+    )
+
+    # Reports are written out as they complete; only scores are kept for the summary
+    json_path = args.jsonl or args.json
+    writer = None
+    reports: list[ReportSummary] = []
+
+    cache = load_report_cache(args.cache) if args.cache else None
+
+    def finish(report: QualityReport) -> None:
+        reports.append(ReportSummary(report.file_path, report.overall_score))
         print_report(report, args.verbose)
+        if writer is not None:
+            writer.write(report)
+        if cache is not None:
+            cache_report(
+                cache, report, skip_musical=args.skip_musical, provider=provider, model=model
+            )
+
+    # Check files concurrently (each check is dominated by the AI round-trip);
+    # reports are printed from this thread as they complete so output never interleaves
+    with ExitStack() as stack:
+        if json_path:
+            stream = stack.enter_context(open(json_path, "wb"))
+            writer = JsonReportWriter(stream, len(files), jsonl=args.jsonl is not None)
+        executor: Executor
+        if use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=args.processes, initializer=_init_worker, initargs=(provider,)
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        stack.enter_context(executor)
+        futures = []
+        for file_path in sorted(files):
+            if cache is not None:
+                report = cached_report(
+                    cache, file_path, skip_musical=args.skip_musical, provider=provider, model=model
+                )
+                if report is not None:
+                    if args.verbose:
+                        print(f"Unchanged since last run: {file_path.name}")
+                    finish(report)
+                    continue
+            if args.verbose:
+                print(f"Checking: {file_path.name}...")
+            if ai_batch > 1:
+                futures.append(executor.submit(check_for_batch, file_path, args.skip_musical))
+            elif use_processes:
+                futures.append(
+                    executor.submit(_check_in_worker, file_path, provider, model, args.skip_musical)
+                )
+            else:
+                futures.append(
+                    executor.submit(
+                        check_midi_file,
+                        file_path,
+                        provider,
+                        model,
+                        client=client,
+                        skip_musical=args.skip_musical,
+                    )
+                )
+
+        if ai_batch == 1:
+            for future in as_completed(futures):
+                finish(future.result())
+        else:
+            # Gather the checked files, then send their AI assessments in batches
+            pending: list[tuple[Any, QualityReport]] = []
+            for future in as_completed(futures):
+                report, composition = future.result()
+                if composition is None:
+                    finish(report)
+                else:
+                    pending.append((composition, report))
+            pending.sort(key=lambda item: item[1].file_path)
+            batches = [pending[i : i + ai_batch] for i in range(0, len(pending), ai_batch)]
+            ai_executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            batch_futures = {
+                ai_executor.submit(get_ai_assessments, batch, provider, model, client): batch
+                for batch in batches
+            }
+            for future in as_completed(batch_futures):
+                future.result()
+                for _, report in batch_futures[future]:
+                    # Failed assessments add warnings, which count toward the scores
+                    report.calculate_scores()
+                    finish(report)
+
+        if writer is not None:
+            writer.finish()
+    if client is not None and hasattr(client, "close"):
+        client.close()
+    if cache is not None:
+        args.cache.write_bytes(dumps_json(cache))
 
     # Summary
     if len(reports) > 1:
@@ -134,8 +483,11 @@ def main() -> int:
         print(f"Summary: {len(reports)} files checked")
         print(f"{'=' * 60}")
 
-        passed = [r for r in reports if r.overall_score >= args.min_score]
-        failed = [r for r in reports if r.overall_score < args.min_score]
+        # Partition in a single pass over the summaries
+        passed: list[ReportSummary] = []
+        failed: list[ReportSummary] = []
+        for r in reports:
+            (passed if r.overall_score >= args.min_score else failed).append(r)
 
         print(f"✅ Passed (score >= {args.min_score:.0%}): {len(passed)}")
         print(f"❌ Failed (score < {args.min_score:.0%}): {len(failed)}")
@@ -146,21 +498,16 @@ def main() -> int:
 
         if failed:
             print("\nFailed files:")
-            for r in failed:
+            # Only the listed failures need a stable order, not every report
+            for r in sorted(failed):
                 print(f"  {r.file_path.name}: {r.overall_score:.2%}")
 
     # JSON output
-    if args.json:
-        output = {
-            "files_checked": len(reports),
-            "reports": [r.to_dict() for r in reports],
-        }
-        args.json.write_text(json.dumps(output, indent=2), encoding="utf-8")
-        print(f"\nResults saved to: {args.json}")
+    if json_path:
+        print(f"\nResults saved to: {json_path}")
 
     # Return code
-    failed_count = sum(1 for r in reports if r.overall_score < args.min_score)
-    return 0 if failed_count == 0 else 1
+    return 0 if all(r.overall_score >= args.min_score for r in reports) else 1
 
 
 if __name__ == "__main__":
@@ -5,32 +5,49 @@ Extract example user prompts from AI_PROMPTING_GUIDE.md and create:
 - <Composition Name>.json (a blank json file)
 """
 
+import mmap
+import os
 import re
 from pathlib import Path
 
+# Title patterns, tried in order by extract_title_from_prompt
+_TITLE_QUOTED = re.compile(r'Title:\s*"([^"]+)"')
+_TITLE_BARE = re.compile(r"Title:\s*([^\n]+)")
+_CALLED = re.compile(r'called\s+"([^"]+)"')
+# Any quoted string that looks like a title, e.g. "Something in Key" or "Something - Description"
+_QUOTED_FALLBACK = re.compile(r'"([A-Z][^"]*(?:in|in\s+[A-G][#b]?\s+[A-Z][^"]*|-\s+[^"]*))"')
+
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r"\s+")
+
+# Code blocks (with or without language tags): ``` or ```language, content, closing ```
+# (bytes pattern: the guide is scanned through an mmap rather than read into a str)
+_CODE_BLOCK = re.compile(rb"```[^\n]*\n(.*?)\n```", re.DOTALL)
+
+# Openings that mark a code block as an example user prompt
+_PROMPT_PREFIXES = ("Compose a", "Compose an", "Create a", "Create an", "I'd like", "Title:")
+_PROMPT_FIRST_BYTES = b"CIT"
+
 
 def extract_title_from_prompt(prompt_text: str) -> str:
     """Extract the composition title from the prompt text."""
     # Try to find Title: "..." pattern
-    title_match = re.search(r'Title:\s*"([^"]+)"', prompt_text)
+    title_match = _TITLE_QUOTED.search(prompt_text)
     if title_match:
         return title_match.group(1)
 
     # Try to find Title: ... (without quotes)
-    title_match = re.search(r"Title:\s*([^\n]+)", prompt_text)
+    title_match = _TITLE_BARE.search(prompt_text)
     if title_match:
         return title_match.group(1).strip()
 
     # Try to find "called "..." pattern
-    called_match = re.search(r'called\s+"([^"]+)"', prompt_text)
+    called_match = _CALLED.search(prompt_text)
     if called_match:
         return called_match.group(1)
 
     # Fallback: try to find any quoted string that looks like a title
-    # Look for patterns like "Something in Key" or "Something - Description"
-    quoted_match = re.search(
-        r'"([A-Z][^"]*(?:in|in\s+[A-G][#b]?\s+[A-Z][^"]*|-\s+[^"]*))"', prompt_text
-    )
+    quoted_match = _QUOTED_FALLBACK.search(prompt_text)
     if quoted_match:
         return quoted_match.group(1)
 
@@ -41,9 +58,9 @@ def sanitize_filename(name: str) -> str:
     """Convert a composition name to a safe filename."""
     # Remove or replace invalid filename characters
     # Keep alphanumeric, spaces, hyphens, underscores
-    name = re.sub(r'[<>:"/\\|?*]', "", name)
+    name = _INVALID_FILENAME_CHARS.sub("", name)
     # Replace multiple spaces with single space
-    name = re.sub(r"\s+", " ", name)
+    name = _WHITESPACE.sub(" ", name)
     return name.strip()
 
 
@@ -52,28 +69,36 @@ def extract_prompts_from_markdown(markdown_path: Path) -> list[tuple[str, str]]:
     Extract all prompts from the markdown file.
     Returns list of (title, prompt_text) tuples.
     """
-    with open(markdown_path, encoding="utf-8") as f:
-        content = f.read()
-
     prompts = []
 
-    # Find all code blocks (with or without language tags)
-    # Pattern matches: ``` or ```language followed by content and closing ```
-    code_block_pattern = r"```[^\n]*\n(.*?)\n```"
-    code_blocks = re.finditer(code_block_pattern, content, re.DOTALL)
+    with open(markdown_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return prompts  # mmap can't map an empty file
+        # Find all code blocks (with or without language tags) without reading the
+        # whole file into a str; only the matched blocks are copied and decoded
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            blocks = [match.group(1) for match in _CODE_BLOCK.finditer(content)]
+
+    for block in blocks:
+        # Fast-fail on the first byte before decoding: every prompt prefix opens with
+        # C, I or T, which also rules out JSON examples ("{") and bash commands ("#").
+        # Non-ASCII leads go on to the full check, since str.strip() may remove them.
+        first = block.lstrip()[:1]
+        if first < b"\x80" and first not in _PROMPT_FIRST_BYTES:
+            continue
 
-    for match in code_blocks:
-        block_content = match.group(1).strip()
+        block_content = block.decode("utf-8")
+        if "\r" in block_content:
+            # Match the newline translation of text-mode reads
+            block_content = block_content.replace("\r\n", "\n").replace("\r", "\n")
+        block_content = block_content.strip()
 
-        # Skip JSON examples and bash commands
-        if block_content.startswith(("{", "#")) or "bpm" in block_content[:50]:
+        # Skip spec-style examples that mention the tempo up front
+        if "bpm" in block_content[:50]:
             continue
 
         # Check if this looks like a user prompt (not a JSON example or other code)
-        if any(
-            block_content.startswith(prefix)
-            for prefix in ["Compose a", "Compose an", "Create a", "Create an", "I'd like", "Title:"]
-        ):
+        if block_content.startswith(_PROMPT_PREFIXES):
             # Extract title
             title = extract_title_from_prompt(block_content)
             if title:
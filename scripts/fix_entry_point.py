@@ -8,9 +8,33 @@ script properly processes .pth files for editable installs.
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
+# Lines the injected block is spliced between
+_IMPORT_SYS_LINE = "import sys"
+_ENTRY_IMPORT_LINE = "from pianist.entry import main"
+
+# Block inserted after `import sys` to process .pth files before importing pianist
+_INJECTED_BLOCK = """import site
+import sysconfig
+from pathlib import Path
+
+# Process .pth files for editable installs before importing
+site.main()
+
+# Manually process .pth files if needed (fallback for Python 3.14+); the
+# interpreter reports its site-packages directly, so venv/lib isn't listed
+site_packages = Path(sysconfig.get_paths()["purelib"])
+pth_file = site_packages / "__editable__.pianist-0.1.0.pth"
+if pth_file.exists():
+    pth_path = pth_file.read_text().strip()
+    if pth_path and Path(pth_path).exists() and str(pth_path) not in sys.path:
+        sys.path.insert(0, str(pth_path))
+
+"""
+
 
 def fix_entry_point_script(script_path: Path) -> bool:
     """Fix the entry point script to process .pth files before importing."""
@@ -25,32 +49,14 @@ def fix_entry_point_script(script_path: Path) -> bool:
         print(f"Entry point script already fixed: {script_path}")
         return True
 
-    # Find the import line and add site.main() before it
-    import re
-
-    # Pattern to match: import sys\nfrom pianist.entry import main
-    pattern = r"^(import sys\n)(from pianist\.entry import main)$"
-
-    replacement = r"""\1import site
-from pathlib import Path
-
-# Process .pth files for editable installs before importing
-site.main()
-
-# Manually process .pth files if needed (fallback for Python 3.14+)
-venv_root = Path(__file__).parent.parent
-site_packages = venv_root / "lib"
-python_dirs = [d for d in site_packages.iterdir() if d.is_dir() and d.name.startswith("python")]
-if python_dirs:
-    pth_file = python_dirs[0] / "site-packages" / "__editable__.pianist-0.1.0.pth"
-    if pth_file.exists():
-        pth_path = pth_file.read_text().strip()
-        if pth_path and Path(pth_path).exists() and str(pth_path) not in sys.path:
-            sys.path.insert(0, str(pth_path))
-
-\2"""
-
-    new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+    # Find `import sys` directly followed by the entry import and splice the block between
+    lines = content.splitlines(keepends=True)
+    new_content = content
+    for i in range(1, len(lines)):
+        if lines[i].rstrip() == _ENTRY_IMPORT_LINE and lines[i - 1].rstrip() == _IMPORT_SYS_LINE:
+            lines[i:i] = [_INJECTED_BLOCK]
+            new_content = "".join(lines)
+            break
 
     if new_content != content:
         script_path.write_text(new_content)
@@ -62,25 +68,33 @@ if python_dirs:
         return False
 
 
+def find_entry_script(candidate_dirs: list[Path], name: str = "pianist") -> Path | None:
+    """Return the first `name` file found in the candidate directories, listing each once."""
+    for directory in candidate_dirs:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == name and entry.is_file():
+                        return Path(entry.path)
+        except OSError:
+            continue  # Missing or unreadable directory
+    return None
+
+
 def main() -> int:
     """Main entry point."""
     # Find the entry point script
     import sysconfig
 
     scripts_dir = Path(sysconfig.get_path("scripts"))
-    entry_script = scripts_dir / "pianist"
-
     # Also check common venv locations
-    if not entry_script.exists():
-        # Try to find it in the current venv
-        venv_bin = Path(sys.prefix) / "bin" / "pianist"
-        if venv_bin.exists():
-            entry_script = venv_bin
+    venv_bin = Path(sys.prefix) / "bin"
+    entry_script = find_entry_script([scripts_dir, venv_bin])
 
-    if not entry_script.exists():
+    if entry_script is None:
         print("Error: Could not find entry point script 'pianist'")
         print(f"  Checked: {scripts_dir / 'pianist'}")
-        print(f"  Checked: {Path(sys.prefix) / 'bin' / 'pianist'}")
+        print(f"  Checked: {venv_bin / 'pianist'}")
         return 1
 
     if fix_entry_point_script(entry_script):
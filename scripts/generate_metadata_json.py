@@ -32,6 +32,11 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
 # Metadata JSON schema template
 # Only composer and title are required. Other fields are optional and will be
 # determined automatically during the review process.
@@ -52,17 +57,21 @@ METADATA_TEMPLATE = {
 
 def load_existing_metadata(json_path: Path) -> dict[str, any]:
     """Load existing metadata JSON if it exists."""
-    if json_path.exists():
-        try:
-            with open(json_path, encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            print(f"Warning: Invalid JSON in {json_path}: {e}", file=sys.stderr)
-            return {}
-        except Exception as e:
-            print(f"Warning: Could not load {json_path}: {e}", file=sys.stderr)
-            return {}
-    return {}
+    try:
+        data = json_path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Warning: Could not load {json_path}: {e}", file=sys.stderr)
+        return {}
+    try:
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except json.JSONDecodeError as e:
+        print(f"Warning: Invalid JSON in {json_path}: {e}", file=sys.stderr)
+        return {}
+    except Exception as e:
+        print(f"Warning: Could not load {json_path}: {e}", file=sys.stderr)
+        return {}
 
 
 def prompt_for_value(prompt: str, default: str | None = None, required: bool = False) -> str | None:
@@ -199,20 +208,31 @@ def generate_metadata_from_args(
 
 def save_metadata(json_path: Path, metadata: dict[str, any], update: bool = False) -> None:
     """Save metadata to JSON file."""
-    if json_path.exists() and not update:
-        response = input(f"{json_path} already exists. Overwrite? [y/N]: ").strip().lower()
-        if response != "y":
-            print("Cancelled.")
-            return
-
     # Ensure required fields
     if not metadata.get("composer") or not metadata.get("title"):
         print("Error: Both composer and title are required.", file=sys.stderr)
         sys.exit(1)
 
-    # Write JSON file with pretty formatting
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    # Pretty-formatted JSON
+    if orjson is not None:
+        data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8")
+
+    if update:
+        json_path.write_bytes(data)
+    else:
+        # Exclusive create: a new file needs no separate existence check, and an
+        # existing one is only replaced after confirmation
+        try:
+            with open(json_path, "xb") as f:
+                f.write(data)
+        except FileExistsError:
+            response = input(f"{json_path} already exists. Overwrite? [y/N]: ").strip().lower()
+            if response != "y":
+                print("Cancelled.")
+                return
+            json_path.write_bytes(data)
 
     print(f"✓ Saved metadata to {json_path}")
 
@@ -305,10 +325,8 @@ Examples:
 
     json_path = midi_path.with_suffix(midi_path.suffix + ".json")
 
-    # Load existing metadata if updating
-    existing = None
-    if args.update or json_path.exists():
-        existing = load_existing_metadata(json_path)
+    # Load existing metadata (empty if there is no JSON file yet)
+    existing = load_existing_metadata(json_path)
 
     # Generate metadata
     if args.composer or args.title:
@@ -23,18 +23,91 @@ from __future__ import annotations
 
 import argparse
 import csv
+import io
 import json
+import os
 import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+import numpy as np
+
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# All fields that the review script can generate
+REVIEW_FIELDS = (
+    "filename",
+    "filepath",
+    "quality_score",
+    "quality_issues",
+    "suggested_name",
+    "suggested_id",
+    "suggested_style",
+    "suggested_description",
+    "detected_key",
+    "detected_form",
+    "duration_beats",
+    "duration_seconds",
+    "bars",
+    "tempo_bpm",
+    "time_signature",
+    "key_signature",
+    "tracks",
+    "motif_count",
+    "phrase_count",
+    "chord_count",
+    "harmonic_progression",
+    "is_duplicate",
+    "duplicate_group",
+    "similar_files",
+    "similarity_scores",
+    "technical_score",
+    "musical_score",
+    "structure_score",
+    "is_original",
+)
+
+# Row key under which build_duplicate_groups stores the parsed similar_files list
+SIMILAR_FILES_PARSED = "_similar_files_parsed"
+
+# Row key under which read_review_csv stores the parsed is_original flag
+IS_ORIGINAL = "_is_original"
+
+# Row key under which the rename pass stores the row's new filename
+NEW_FILENAME = "_new_filename"
+
+# Write buffer for the CSV reports, so per-row writes reach the disk in large blocks
+CSV_BUFFER_SIZE = 1 << 20
+
+# Values of yes/no CSV fields (after strip/lower) that count as set
+_TRUTHY = frozenset(("yes", "true", "1"))
+
+# One "filename: score" pair of a similarity_scores field. Pairs are anchored to
+# the ";" separators, so a malformed pair is skipped rather than partly matched.
+_SIMILARITY_SCORE = re.compile(
+    r"(?:^|;)\s*([^:;]*?)\s*:\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(?=;|$)"
+)
+
+# Patterns used by sanitize_filename, compiled once for the many suggested names
+_SANITIZE_BAD = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_SANITIZE_WS = re.compile(r"\s+")
+
+# MIDI file extension, stripped to get the fallback ID/title for the import metadata
+_MIDI_SUFFIX = re.compile(r"\.midi?$")
 
 
 def sanitize_filename(name: str, max_length: int = 200) -> str:
     """Convert a suggested name to a valid filename."""
-    name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _SANITIZE_BAD.sub("", name)
+    name = _SANITIZE_WS.sub(" ", name).strip()
     if len(name) > max_length:
         name = name[:max_length].rsplit(" ", 1)[0]
     return name
@@ -48,6 +121,23 @@ def generate_filename(suggested_name: str, suggested_id: str) -> str:
     return f"{clean_name}.mid" if not clean_name.endswith(".mid") else clean_name
 
 
+def dumps_json(data: Any) -> bytes:
+    """Serialize to pretty-printed UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write pretty-printed UTF-8 JSON."""
+    path.write_bytes(dumps_json(data))
+
+
+def open_csv_for_writing(path: Path) -> TextIO:
+    """Open a CSV report for writing with a large write buffer."""
+    return open(path, "w", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE)
+
+
 def parse_similar_files(similar_files_str: str) -> list[str]:
     """Parse semicolon-separated list of similar files."""
     if not similar_files_str or not similar_files_str.strip():
@@ -57,24 +147,27 @@ def parse_similar_files(similar_files_str: str) -> list[str]:
 
 def parse_similarity_scores(similarity_scores_str: str) -> dict[str, float]:
     """Parse similarity scores string format: 'file1: 0.85; file2: 0.72'."""
-    scores: dict[str, float] = {}
-    if not similarity_scores_str or not similarity_scores_str.strip():
-        return scores
-    for pair_raw in similarity_scores_str.split(";"):
-        pair = pair_raw.strip()
-        if ":" in pair:
-            filename, score_str = pair.split(":", 1)
-            try:
-                scores[filename.strip()] = float(score_str.strip())
-            except ValueError:
-                continue
-    return scores
+    if not similarity_scores_str:
+        return {}
+    return {
+        filename.strip(): float(score)
+        for filename, score in _SIMILARITY_SCORE.findall(similarity_scores_str)
+    }
+
+
+def _truthy(value: str | None) -> bool:
+    """Whether a yes/no CSV field is set ("yes", "true" or "1", any case)."""
+    return bool(value) and value.strip().lower() in _TRUTHY
+
+
+def is_original_row(row: dict[str, Any]) -> bool:
+    """Whether a row is marked as an original composition (precomputed when read)."""
+    flag = row.get(IS_ORIGINAL)
+    return _truthy(row.get("is_original")) if flag is None else flag
 
 
 def safe_float(value: Any, default: float = 0.0) -> float:
-    """Safely convert value to float."""
-    if value == "" or value is None:
-        return default
+    """Safely convert value to float (empty and missing values give the default)."""
     try:
         return float(value)
     except (ValueError, TypeError):
@@ -82,71 +175,251 @@ def safe_float(value: Any, default: float = 0.0) -> float:
 
 
 def safe_int(value: Any, default: int = 0) -> int:
-    """Safely convert value to int."""
-    if value == "" or value is None:
-        return default
+    """Safely convert value to int (empty and missing values give the default)."""
     try:
         return int(float(value))
     except (ValueError, TypeError):
         return default
 
 
-def build_duplicate_groups(rows: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+@dataclass
+class ReviewData:
+    """Rows of a review report and the indexes built while reading them."""
+
+    rows: list[dict[str, Any]]
+    available_fields: set[str]
+    # Filenames of the rows missing each (available) review field
+    missing_fields: dict[str, list[str]]
+    filename_to_row: dict[str, dict[str, Any]]
+    # Rows by non-empty duplicate_group value
+    groups_by_id: dict[str, list[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Names in a directory, read with one scandir so membership needs no stat calls."""
+
+    directory: Path
+    names: frozenset[str]
+    folded_names: frozenset[str]
+
+    @classmethod
+    def scan(cls, directory: Path) -> DirectoryListing:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(entry.name for entry in entries)
+        except OSError:
+            names = frozenset()  # Missing or unreadable; renames into it will report errors
+        return cls(directory, names, frozenset(name.casefold() for name in names))
+
+    def contains(self, name: str) -> bool:
+        """Whether ``name`` exists in the directory (as Path.exists() would report)."""
+        if name in self.names:
+            return True
+        # Case-insensitive filesystems and nested paths can't be settled from the listing
+        if name.casefold() in self.folded_names or "/" in name or os.sep in name:
+            return (self.directory / name).exists()
+        return False
+
+
+def read_review_csv(csv_path: Path) -> ReviewData:
+    """
+    Read a review report, building the per-field completeness data, the filename
+    index and the duplicate_group buckets in the same pass.
+    """
+    rows: list[dict[str, Any]] = []
+    missing_fields: dict[str, list[str]] = defaultdict(list)
+    filename_to_row: dict[str, dict[str, Any]] = {}
+    groups_by_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    # csv.reader rather than DictReader: the completeness check runs on the raw
+    # value lists by column index, and each row dict is built directly (with
+    # DictReader's handling of short and long rows)
+    with open(csv_path, encoding="utf-8") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        n_fields = len(fieldnames)
+        column = {name: i for i, name in enumerate(fieldnames)}
+        tracked_columns = [(field, column[field]) for field in REVIEW_FIELDS if field in column]
+        filename_column = column.get("filename")
+        for values in reader:
+            if not values:
+                continue  # Blank line
+            if len(values) < n_fields:
+                values.extend([None] * (n_fields - len(values)))
+            row: dict[Any, Any] = dict(zip(fieldnames, values, strict=False))
+            if len(values) > n_fields:
+                row[None] = values[n_fields:]
+            row[IS_ORIGINAL] = _truthy(row.get("is_original"))
+            rows.append(row)
+
+            filename = "unknown" if filename_column is None else values[filename_column]
+            for field, i in tracked_columns:
+                value = values[i]
+                if value == "" or value is None:
+                    missing_fields[field].append(filename)
+            filename_to_row[row["filename"]] = row
+            group_id = row.get("duplicate_group", "").strip()
+            if group_id:
+                groups_by_id[group_id].append(row)
+
+    return ReviewData(
+        rows=rows,
+        available_fields=set(fieldnames) if rows else set(),
+        missing_fields=dict(missing_fields),
+        filename_to_row=filename_to_row,
+        groups_by_id=dict(groups_by_id),
+    )
+
+
+def build_duplicate_groups(data: ReviewData) -> dict[str, list[dict[str, Any]]]:
     """
     Build duplicate groups from duplicate_group field or similar_files relationships.
 
     Uses duplicate_group if available (more efficient), otherwise builds from similar_files graph.
     """
-    # First, try using duplicate_group field if available
-    groups_by_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    filename_to_row: dict[str, dict[str, Any]] = {row["filename"]: row for row in rows}
-
-    for row in rows:
-        group_id = row.get("duplicate_group", "").strip()
-        if group_id:
-            groups_by_id[group_id].append(row)
+    rows = data.rows
+    filename_to_row = data.filename_to_row
 
     # If we have groups from duplicate_group field, use them
-    if groups_by_id:
+    if data.groups_by_id:
         # Filter to only groups with 2+ files
-        return {gid: files for gid, files in groups_by_id.items() if len(files) > 1}
-
-    # Otherwise, build from similar_files graph
-    similar_graph: dict[str, set[str]] = defaultdict(set)
+        return {gid: files for gid, files in data.groups_by_id.items() if len(files) > 1}
+
+    # Otherwise, group files connected through similar_files with a union-find
+    # over integer ids (iterative, so large similarity graphs can't hit the
+    # recursion limit). Links to files not in the report are ignored.
+    file_ids = {filename: i for i, filename in enumerate(filename_to_row)}
+    parent = list(range(len(file_ids)))
+    rank = [0] * len(file_ids)
+
+    def find(i: int) -> int:
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:  # Path compression
+            parent[i], i = root, parent[i]
+        return root
 
     for row in rows:
-        filename = row["filename"]
-        similar_files = parse_similar_files(row.get("similar_files", ""))
+        a = file_ids[row["filename"]]
+        # Kept on the row so extract_metadata doesn't parse the list again
+        similar_files = row[SIMILAR_FILES_PARSED] = parse_similar_files(
+            row.get("similar_files", "")
+        )
         for similar_file in similar_files:
-            similar_graph[filename].add(similar_file)
-            similar_graph[similar_file].add(filename)
+            b = file_ids.get(similar_file)
+            if b is None:
+                continue
+            root_a, root_b = find(a), find(b)
+            if root_a == root_b:
+                continue
+            # Union by rank
+            if rank[root_a] < rank[root_b]:
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            if rank[root_a] == rank[root_b]:
+                rank[root_a] += 1
+
+    # Bucket files by root; groups and their files keep report order
+    components: dict[int, list[dict[str, Any]]] = defaultdict(list)
+    for filename, i in file_ids.items():
+        components[find(i)].append(filename_to_row[filename])
 
-    # Find connected components
-    visited: set[str] = set()
     groups: dict[str, list[dict[str, Any]]] = {}
-    group_counter = 0
-
-    def dfs(node: str, current_group: list[str]) -> None:
-        if node in visited or node not in filename_to_row:
-            return
-        visited.add(node)
-        current_group.append(node)
-        for neighbor in similar_graph.get(node, set()):
-            if neighbor in filename_to_row:
-                dfs(neighbor, current_group)
-
-    for filename in filename_to_row:
-        if filename not in visited:
-            current_group: list[str] = []
-            dfs(filename, current_group)
-            if len(current_group) > 1:
-                group_id = f"group_{group_counter:03d}"
-                groups[group_id] = [filename_to_row[f] for f in current_group]
-                group_counter += 1
+    for component in components.values():
+        if len(component) > 1:
+            groups[f"group_{len(groups):03d}"] = component
 
     return groups
 
 
+def duplicate_csv_row(group_id: str, meta: dict[str, Any]) -> dict[str, Any]:
+    """Build a duplicate groups CSV row from a file's metadata."""
+    # join() materializes its input anyway, so hand it a list rather than a generator
+    similarity_str = "; ".join([f"{f}: {s:.3f}" for f, s in meta["similarity_scores"].items()])
+    return {
+        "group_id": group_id,
+        "filename": meta["filename"],
+        "suggested_name": meta["suggested_name"],
+        "suggested_style": meta["suggested_style"],
+        "quality_score": f"{meta['quality_score']:.3f}",
+        "technical_score": f"{meta['technical_score']:.3f}",
+        "musical_score": f"{meta['musical_score']:.3f}",
+        "structure_score": f"{meta['structure_score']:.3f}",
+        "detected_key": meta["detected_key"],
+        "detected_form": meta["detected_form"],
+        "duration_beats": f"{meta['duration_beats']:.1f}",
+        "bars": f"{meta['bars']:.1f}",
+        "tempo_bpm": f"{meta['tempo_bpm']:.1f}" if meta["tempo_bpm"] else "",
+        "time_signature": meta["time_signature"],
+        "motif_count": meta["motif_count"],
+        "phrase_count": meta["phrase_count"],
+        "chord_count": meta["chord_count"],
+        "is_original": "Yes" if meta["is_original"] else "No",
+        "similarity_scores": similarity_str,
+    }
+
+
+# Columns of the batch import metadata CSV, in the order import_csv_row emits them
+IMPORT_METADATA_FIELDS = (
+    "filename",
+    "id",
+    "title",
+    "description",
+    "style",
+    "form",
+    "techniques",
+    "detected_key",
+    "tempo_bpm",
+    "duration_beats",
+    "quality_score",
+    "technical_score",
+    "musical_score",
+    "structure_score",
+    "motif_count",
+    "phrase_count",
+    "chord_count",
+    "harmonic_progression",
+    "time_signature",
+    "bars",
+)
+
+
+def import_csv_row(meta: dict[str, Any], filename: str) -> tuple[Any, ...]:
+    """Build an import metadata CSV row (in IMPORT_METADATA_FIELDS order) for ``filename``."""
+    # Limit harmonic progression length
+    harmonic_prog = meta["harmonic_progression"]
+    if harmonic_prog:
+        harmonic_prog = " ".join(harmonic_prog.split()[:10])
+    stem = _MIDI_SUFFIX.sub("", meta["filename"])
+
+    return (
+        filename,  # filename
+        meta["suggested_id"] or stem,  # id
+        meta["suggested_name"] or stem,  # title
+        meta["suggested_description"]
+        or meta["suggested_name"]
+        or "Musical composition",  # description
+        meta["suggested_style"] or "",  # style
+        meta["detected_form"] or "",  # form
+        "",  # techniques (left empty for manual addition)
+        meta["detected_key"] or "",  # detected_key
+        f"{meta['tempo_bpm']:.1f}" if meta["tempo_bpm"] else "",  # tempo_bpm
+        f"{meta['duration_beats']:.1f}" if meta["duration_beats"] else "",  # duration_beats
+        f"{meta['quality_score']:.3f}" if meta["quality_score"] else "",  # quality_score
+        f"{meta['technical_score']:.3f}" if meta["technical_score"] else "",  # technical_score
+        f"{meta['musical_score']:.3f}" if meta["musical_score"] else "",  # musical_score
+        f"{meta['structure_score']:.3f}" if meta["structure_score"] else "",  # structure_score
+        meta["motif_count"] if meta["motif_count"] else "",  # motif_count
+        meta["phrase_count"] if meta["phrase_count"] else "",  # phrase_count
+        meta["chord_count"] if meta["chord_count"] else "",  # chord_count
+        harmonic_prog or "",  # harmonic_progression
+        meta["time_signature"] or "",  # time_signature
+        f"{meta['bars']:.1f}" if meta["bars"] else "",  # bars
+    )
+
+
 def identify_exclusions(
     rows: list[dict[str, Any]],
     min_quality: float = 0.7,
@@ -157,155 +430,167 @@ def identify_exclusions(
     """Identify files that should be excluded from the database."""
     exclusions: list[dict[str, Any]] = []
 
-    for row in rows:
-        reasons: list[str] = []
+    # Parse each score column once and apply the thresholds to whole columns
+    def column(field: str) -> np.ndarray:
+        return np.fromiter(
+            (safe_float(row.get(field, 0)) for row in rows), dtype=np.float64, count=len(rows)
+        )
 
-        quality_score = safe_float(row.get("quality_score", 0))
-        technical_score = safe_float(row.get("technical_score", 0))
-        musical_score = safe_float(row.get("musical_score", 0))
-        structure_score = safe_float(row.get("structure_score", 0))
+    quality = column("quality_score")
+    technical = column("technical_score")
+    musical = column("musical_score")
+    structure = column("structure_score")
+    duration = column("duration_beats")
+
+    low_quality = quality < min_quality
+    low_technical = technical < min_technical
+    low_musical = musical < min_musical
+    low_structure = structure < min_structure
+    too_short = (duration > 0) & (duration < 20)
+    too_long = duration > 1000
+    flagged = low_quality | low_technical | low_musical | low_structure | too_short | too_long
+
+    for i, row in enumerate(rows):
+        # Missing critical metadata
+        missing_name = not row.get("suggested_name") or not row.get("suggested_name", "").strip()
+        missing_key = not row.get("detected_key")
+        missing_form = not row.get("detected_form")
+
+        # Check if marked as original (might want to exclude originals)
+        is_original = is_original_row(row)
+
+        if not (flagged[i] or missing_name or missing_key or missing_form or is_original):
+            continue
+
+        quality_score = float(quality[i])
+        technical_score = float(technical[i])
+        musical_score = float(musical[i])
+        structure_score = float(structure[i])
+        duration_beats = float(duration[i])
+        reasons: list[str] = []
 
         # Quality thresholds
-        if quality_score < min_quality:
+        if low_quality[i]:
             reasons.append(f"Low quality score: {quality_score:.3f} < {min_quality}")
-        if technical_score < min_technical:
+        if low_technical[i]:
             reasons.append(f"Low technical score: {technical_score:.3f} < {min_technical}")
-        if musical_score < min_musical:
+        if low_musical[i]:
             reasons.append(f"Low musical score: {musical_score:.3f} < {min_musical}")
-        if structure_score < min_structure:
+        if low_structure[i]:
             reasons.append(f"Low structure score: {structure_score:.3f} < {min_structure}")
 
         # Duration checks
-        duration_beats = safe_float(row.get("duration_beats", 0))
-        if duration_beats > 0:
-            if duration_beats < 20:
-                reasons.append(f"Very short: {duration_beats:.1f} beats (likely fragment)")
-            if duration_beats > 1000:
-                reasons.append(f"Very long: {duration_beats:.1f} beats (might be multi-movement)")
+        if too_short[i]:
+            reasons.append(f"Very short: {duration_beats:.1f} beats (likely fragment)")
+        if too_long[i]:
+            reasons.append(f"Very long: {duration_beats:.1f} beats (might be multi-movement)")
 
-        # Missing critical metadata
-        if not row.get("suggested_name") or not row.get("suggested_name", "").strip():
+        if missing_name:
             reasons.append("Missing suggested_name")
-        if not row.get("detected_key"):
+        if missing_key:
             reasons.append("Missing detected_key")
-        if not row.get("detected_form"):
+        if missing_form:
             reasons.append("Missing detected_form")
-
-        # Check if marked as original (might want to exclude originals)
-        is_original = row.get("is_original", "").strip().lower() in ("yes", "true", "1")
         if is_original:
             reasons.append("Marked as original composition (may want to exclude)")
 
-        if reasons:
-            exclusions.append(
-                {
-                    "filename": row["filename"],
-                    "quality_score": quality_score,
-                    "technical_score": technical_score,
-                    "musical_score": musical_score,
-                    "structure_score": structure_score,
-                    "suggested_name": row.get("suggested_name", ""),
-                    "is_original": is_original,
-                    "reasons": reasons,
-                }
-            )
+        exclusions.append(
+            {
+                "filename": row["filename"],
+                "quality_score": quality_score,
+                "technical_score": technical_score,
+                "musical_score": musical_score,
+                "structure_score": structure_score,
+                "suggested_name": row.get("suggested_name", ""),
+                "is_original": is_original,
+                "reasons": reasons,
+            }
+        )
 
     return exclusions
 
 
-def validate_data_completeness(rows: list[dict[str, Any]]) -> dict[str, Any]:
+def validate_data_completeness(data: ReviewData) -> dict[str, Any]:
     """Check if all required fields are present."""
-    # All fields that the review script can generate
-    all_fields = [
-        "filename",
-        "filepath",
-        "quality_score",
-        "quality_issues",
-        "suggested_name",
-        "suggested_id",
-        "suggested_style",
-        "suggested_description",
-        "detected_key",
-        "detected_form",
-        "duration_beats",
-        "duration_seconds",
-        "bars",
-        "tempo_bpm",
-        "time_signature",
-        "key_signature",
-        "tracks",
-        "motif_count",
-        "phrase_count",
-        "chord_count",
-        "harmonic_progression",
-        "is_duplicate",
-        "duplicate_group",
-        "similar_files",
-        "similarity_scores",
-        "technical_score",
-        "musical_score",
-        "structure_score",
-        "is_original",
-    ]
-
-    missing_fields: dict[str, list[str]] = defaultdict(list)
-    total_rows = len(rows)
-
-    # Get available fields from first row
-    available_fields = set(rows[0].keys()) if rows else set()
-
-    for row in rows:
-        filename = row.get("filename", "unknown")
-        for field in all_fields:
-            if field not in available_fields:
-                continue  # Field not in CSV, skip
-            value = row.get(field, "")
-            if value == "" or value is None:
-                missing_fields[field].append(filename)
-
+    total_rows = len(data.rows)
     return {
         "total_files": total_rows,
-        "available_fields": sorted(available_fields),
-        "missing_fields": dict(missing_fields),
+        "available_fields": sorted(data.available_fields),
+        "missing_fields": data.missing_fields,
         "completeness": {
             field: (total_rows - len(files)) / total_rows * 100
-            for field, files in missing_fields.items()
+            for field, files in data.missing_fields.items()
         },
     }
 
 
 def extract_metadata(row: dict[str, Any]) -> dict[str, Any]:
     """Extract all available metadata from a row."""
+    g = row.get  # Bound once for the many lookups below
+    similar_files = g(SIMILAR_FILES_PARSED)
+    if similar_files is None:
+        similar_files = parse_similar_files(g("similar_files", ""))
+    return {
+        "filename": g("filename", ""),
+        "filepath": g("filepath", ""),
+        "quality_score": safe_float(g("quality_score", 0)),
+        "quality_issues": safe_int(g("quality_issues", 0)),
+        "suggested_name": g("suggested_name", ""),
+        "suggested_id": g("suggested_id", ""),
+        "suggested_style": g("suggested_style", ""),
+        "suggested_description": g("suggested_description", ""),
+        "detected_key": g("detected_key", ""),
+        "detected_form": g("detected_form", ""),
+        "duration_beats": safe_float(g("duration_beats", 0)),
+        "duration_seconds": safe_float(g("duration_seconds", 0)),
+        "bars": safe_float(g("bars", 0)),
+        "tempo_bpm": safe_float(g("tempo_bpm", 0)) if g("tempo_bpm") else None,
+        "time_signature": g("time_signature", ""),
+        "key_signature": g("key_signature", ""),
+        "tracks": safe_int(g("tracks", 0)),
+        "motif_count": safe_int(g("motif_count", 0)),
+        "phrase_count": safe_int(g("phrase_count", 0)),
+        "chord_count": safe_int(g("chord_count", 0)),
+        "harmonic_progression": g("harmonic_progression", ""),
+        "is_duplicate": _truthy(g("is_duplicate")),
+        "duplicate_group": g("duplicate_group", ""),
+        "similar_files": similar_files,
+        "similarity_scores": parse_similarity_scores(g("similarity_scores", "")),
+        "technical_score": safe_float(g("technical_score", 0)),
+        "musical_score": safe_float(g("musical_score", 0)),
+        "structure_score": safe_float(g("structure_score", 0)),
+        "is_original": is_original_row(row),
+    }
+
+
+def extract_import_metadata(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    Extract only the metadata fields the import CSV and coverage analysis read.
+
+    Values match `extract_metadata`; the similarity lists and other review-only
+    fields are not parsed.
+    """
+    g = row.get  # Bound once for the many lookups below
     return {
-        "filename": row.get("filename", ""),
-        "filepath": row.get("filepath", ""),
-        "quality_score": safe_float(row.get("quality_score", 0)),
-        "quality_issues": safe_int(row.get("quality_issues", 0)),
-        "suggested_name": row.get("suggested_name", ""),
-        "suggested_id": row.get("suggested_id", ""),
-        "suggested_style": row.get("suggested_style", ""),
-        "suggested_description": row.get("suggested_description", ""),
-        "detected_key": row.get("detected_key", ""),
-        "detected_form": row.get("detected_form", ""),
-        "duration_beats": safe_float(row.get("duration_beats", 0)),
-        "duration_seconds": safe_float(row.get("duration_seconds", 0)),
-        "bars": safe_float(row.get("bars", 0)),
-        "tempo_bpm": safe_float(row.get("tempo_bpm", 0)) if row.get("tempo_bpm") else None,
-        "time_signature": row.get("time_signature", ""),
-        "key_signature": row.get("key_signature", ""),
-        "tracks": safe_int(row.get("tracks", 0)),
-        "motif_count": safe_int(row.get("motif_count", 0)),
-        "phrase_count": safe_int(row.get("phrase_count", 0)),
-        "chord_count": safe_int(row.get("chord_count", 0)),
-        "harmonic_progression": row.get("harmonic_progression", ""),
-        "is_duplicate": row.get("is_duplicate", "").strip().lower() in ("yes", "true", "1"),
-        "duplicate_group": row.get("duplicate_group", ""),
-        "similar_files": parse_similar_files(row.get("similar_files", "")),
-        "similarity_scores": parse_similarity_scores(row.get("similarity_scores", "")),
-        "technical_score": safe_float(row.get("technical_score", 0)),
-        "musical_score": safe_float(row.get("musical_score", 0)),
-        "structure_score": safe_float(row.get("structure_score", 0)),
-        "is_original": row.get("is_original", "").strip().lower() in ("yes", "true", "1"),
+        "filename": g("filename", ""),
+        "quality_score": safe_float(g("quality_score", 0)),
+        "suggested_name": g("suggested_name", ""),
+        "suggested_id": g("suggested_id", ""),
+        "suggested_style": g("suggested_style", ""),
+        "suggested_description": g("suggested_description", ""),
+        "detected_key": g("detected_key", ""),
+        "detected_form": g("detected_form", ""),
+        "duration_beats": safe_float(g("duration_beats", 0)),
+        "bars": safe_float(g("bars", 0)),
+        "tempo_bpm": safe_float(g("tempo_bpm", 0)) if g("tempo_bpm") else None,
+        "time_signature": g("time_signature", ""),
+        "motif_count": safe_int(g("motif_count", 0)),
+        "phrase_count": safe_int(g("phrase_count", 0)),
+        "chord_count": safe_int(g("chord_count", 0)),
+        "harmonic_progression": g("harmonic_progression", ""),
+        "technical_score": safe_float(g("technical_score", 0)),
+        "musical_score": safe_float(g("musical_score", 0)),
+        "structure_score": safe_float(g("structure_score", 0)),
     }
 
 
@@ -323,6 +608,12 @@ def main() -> int:
     parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be done without making changes"
     )
+    parser.add_argument(
+        "--rename-workers",
+        type=int,
+        default=32,
+        help="Renames to keep in flight at once (default: 32; use 1 for strictly serial renames)",
+    )
     parser.add_argument(
         "--min-quality", type=float, default=0.7, help="Minimum quality score (default: 0.7)"
     )
@@ -364,17 +655,24 @@ def main() -> int:
     output_dir = args.output_dir or args.dir
     reports_dir = args.reports_dir or args.csv.parent
 
-    # Read CSV
+    # Progress lines are buffered and flushed once per phase rather than per line
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    def start_phase(title: str) -> None:
+        sys.stdout.flush()
+        print(f"\n=== {title} ===")
+
+    # Read CSV, indexing it as the rows are read
     print(f"Reading review report: {args.csv}")
-    with open(args.csv, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    data = read_review_csv(args.csv)
+    rows = data.rows
 
     print(f"Loaded {len(rows)} file records")
 
     # Validate data completeness
-    print("\n=== Data Completeness Check ===")
-    completeness = validate_data_completeness(rows)
+    start_phase("Data Completeness Check")
+    completeness = validate_data_completeness(data)
     print(f"Total files: {completeness['total_files']}")
     print(f"Available fields: {len(completeness['available_fields'])}")
     if completeness["missing_fields"]:
@@ -385,12 +683,12 @@ def main() -> int:
                 print(f"  {field}: {percent:.1f}% ({missing_count} missing)")
 
     # Build duplicate groups
-    print("\n=== Duplicate Detection ===")
-    duplicate_groups = build_duplicate_groups(rows)
+    start_phase("Duplicate Detection")
+    duplicate_groups = build_duplicate_groups(data)
     print(f"Found {len(duplicate_groups)} duplicate groups")
 
     # Identify exclusions
-    print("\n=== Exclusion Analysis ===")
+    start_phase("Exclusion Analysis")
     exclusions = identify_exclusions(
         rows, args.min_quality, args.min_technical, args.min_musical, args.min_structure
     )
@@ -408,52 +706,81 @@ def main() -> int:
             continue
 
         # Skip originals unless --include-originals (default: exclude)
-        is_original = row.get("is_original", "").strip().lower() in ("yes", "true", "1")
+        is_original = is_original_row(row)
         if is_original and not args.include_originals:
             continue
 
         files_for_import.append(row)
 
+    # Parsed metadata per row (keyed by row identity; rows live for the whole run),
+    # so rows used by several reports are only parsed once
+    metadata_by_row: dict[int, dict[str, Any]] = {}
+
+    def row_metadata(row: dict[str, Any]) -> dict[str, Any]:
+        meta = metadata_by_row.get(id(row))
+        if meta is None:
+            meta = metadata_by_row[id(row)] = extract_metadata(row)
+        return meta
+
+    # Rows outside duplicate groups only need the import fields; rows already
+    # parsed in full for the duplicate reports reuse that
+    import_metadata_by_row: dict[int, dict[str, Any]] = {}
+
+    def row_import_metadata(row: dict[str, Any]) -> dict[str, Any]:
+        meta = metadata_by_row.get(id(row)) or import_metadata_by_row.get(id(row))
+        if meta is None:
+            meta = import_metadata_by_row[id(row)] = extract_import_metadata(row)
+        return meta
+
     # Generate reports
-    print("\n=== Generating Reports ===")
+    start_phase("Generating Reports")
     reports_dir.mkdir(parents=True, exist_ok=True)
 
     # 1. Duplicate groups report (with full metadata)
-    duplicate_report = {"total_groups": len(duplicate_groups), "groups": {}}
-    for group_id, group_files in duplicate_groups.items():
-        duplicate_report["groups"][group_id] = {
-            "count": len(group_files),
-            "files": [extract_metadata(f) for f in group_files],
-        }
-
+    # Written one group at a time rather than built as a single document first;
+    # the output matches json.dump(..., indent=2) of the whole report
     duplicate_report_path = reports_dir / "duplicate_groups_report.json"
-    with open(duplicate_report_path, "w", encoding="utf-8") as f:
-        json.dump(duplicate_report, f, indent=2, ensure_ascii=False)
+    with open(duplicate_report_path, "wb") as f:
+        f.write(b'{\n  "total_groups": %d,\n  "groups": {' % len(duplicate_groups))
+        for n, (group_id, group_files) in enumerate(duplicate_groups.items()):
+            group_report = {
+                "count": len(group_files),
+                "files": [row_metadata(row) for row in group_files],
+            }
+            f.write(b",\n    " if n else b"\n    ")
+            f.write(dumps_json(group_id) + b": ")
+            f.write(dumps_json(group_report).replace(b"\n", b"\n    "))
+        f.write(b"\n  }\n}" if duplicate_groups else b"}\n}")
     print(f"  Duplicate groups JSON: {duplicate_report_path}")
 
     # 2. Exclusions report
     exclusions_report_path = reports_dir / "exclusions_report.json"
-    with open(exclusions_report_path, "w", encoding="utf-8") as f:
-        json.dump(exclusions, f, indent=2, ensure_ascii=False)
+    write_json(exclusions_report_path, exclusions)
     print(f"  Exclusions JSON: {exclusions_report_path}")
 
     # 3. Rename mapping
     rename_mapping: list[dict[str, str]] = []
     rename_conflicts: list[dict[str, Any]] = []
     used_names: dict[str, tuple[str, str]] = {}
+    suffix_counters: dict[str, int] = {}  # base name -> last conflict suffix used
 
-    for row in rows:
-        original_filename = row["filename"]
-        suggested_name = row.get("suggested_name", "")
-        suggested_id = row.get("suggested_id", "")
+    # Bound once for the loop over every row
+    used_names_get = used_names.get
+    rename_mapping_append = rename_mapping.append
 
+    for row in rows:
+        get = row.get
+        suggested_name = get("suggested_name", "")
         if not suggested_name:
             continue
 
+        original_filename = row["filename"]
+        suggested_id = get("suggested_id", "")
         new_filename = generate_filename(suggested_name, suggested_id)
 
-        if new_filename in used_names:
-            conflict_original, conflict_suggested = used_names[new_filename]
+        conflict = used_names_get(new_filename)
+        if conflict is not None:
+            conflict_original, conflict_suggested = conflict
             rename_conflicts.append(
                 {
                     "new_filename": new_filename,
@@ -463,14 +790,18 @@ def main() -> int:
                     "suggested_name_2": suggested_name,
                 }
             )
+            # Resume from the last suffix handed out for this base; every lower
+            # suffix is already taken, so this finds the same name as probing from _01
             base_name = new_filename[:-4]
-            counter = 1
+            counter = suffix_counters.get(base_name, 0)
             while new_filename in used_names:
-                new_filename = f"{base_name}_{counter:02d}.mid"
                 counter += 1
+                new_filename = f"{base_name}_{counter:02d}.mid"
+            suffix_counters[base_name] = counter
 
         used_names[new_filename] = (original_filename, suggested_name)
-        rename_mapping.append(
+        row[NEW_FILENAME] = new_filename
+        rename_mapping_append(
             {
                 "original": original_filename,
                 "new": new_filename,
@@ -480,29 +811,26 @@ def main() -> int:
         )
 
     rename_report_path = reports_dir / "rename_mapping.json"
-    with open(rename_report_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "total_files": len(rename_mapping),
-                "conflicts": len(rename_conflicts),
-                "mapping": rename_mapping,
-                "conflicts_detail": rename_conflicts,
-            },
-            f,
-            indent=2,
-            ensure_ascii=False,
-        )
+    write_json(
+        rename_report_path,
+        {
+            "total_files": len(rename_mapping),
+            "conflicts": len(rename_conflicts),
+            "mapping": rename_mapping,
+            "conflicts_detail": rename_conflicts,
+        },
+    )
     print(f"  Rename mapping JSON: {rename_report_path}")
 
     if rename_conflicts:
         print(f"  WARNING: {len(rename_conflicts)} filename conflicts detected")
 
     # 4. Generate CSV reports
-    print("\n=== Generating CSV Reports ===")
+    start_phase("Generating CSV Reports")
 
     # Duplicate groups CSV (with all metadata)
     duplicate_csv_path = reports_dir / "duplicate_groups_report.csv"
-    with open(duplicate_csv_path, "w", encoding="utf-8", newline="") as f:
+    with open_csv_for_writing(duplicate_csv_path) as f:
         fieldnames = [
             "group_id",
             "filename",
@@ -526,40 +854,16 @@ def main() -> int:
         ]
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        for group_id, group_files in duplicate_groups.items():
-            for file_data in group_files:
-                meta = extract_metadata(file_data)
-                similarity_str = "; ".join(
-                    f"{f}: {s:.3f}" for f, s in meta["similarity_scores"].items()
-                )
-                writer.writerow(
-                    {
-                        "group_id": group_id,
-                        "filename": meta["filename"],
-                        "suggested_name": meta["suggested_name"],
-                        "suggested_style": meta["suggested_style"],
-                        "quality_score": f"{meta['quality_score']:.3f}",
-                        "technical_score": f"{meta['technical_score']:.3f}",
-                        "musical_score": f"{meta['musical_score']:.3f}",
-                        "structure_score": f"{meta['structure_score']:.3f}",
-                        "detected_key": meta["detected_key"],
-                        "detected_form": meta["detected_form"],
-                        "duration_beats": f"{meta['duration_beats']:.1f}",
-                        "bars": f"{meta['bars']:.1f}",
-                        "tempo_bpm": f"{meta['tempo_bpm']:.1f}" if meta["tempo_bpm"] else "",
-                        "time_signature": meta["time_signature"],
-                        "motif_count": meta["motif_count"],
-                        "phrase_count": meta["phrase_count"],
-                        "chord_count": meta["chord_count"],
-                        "is_original": "Yes" if meta["is_original"] else "No",
-                        "similarity_scores": similarity_str,
-                    }
-                )
+        writer.writerows(
+            duplicate_csv_row(group_id, row_metadata(file_data))
+            for group_id, group_files in duplicate_groups.items()
+            for file_data in group_files
+        )
     print(f"  Duplicate groups CSV: {duplicate_csv_path}")
 
     # Exclusions CSV
     exclusions_csv_path = reports_dir / "exclusions_report.csv"
-    with open(exclusions_csv_path, "w", encoding="utf-8", newline="") as f:
+    with open_csv_for_writing(exclusions_csv_path) as f:
         writer = csv.writer(f)
         writer.writerow(
             [
@@ -573,159 +877,76 @@ def main() -> int:
                 "reasons",
             ]
         )
-        for excl in exclusions:
-            writer.writerow(
-                [
-                    excl["filename"],
-                    excl["suggested_name"],
-                    excl["quality_score"],
-                    excl["technical_score"],
-                    excl["musical_score"],
-                    excl["structure_score"],
-                    "Yes" if excl["is_original"] else "No",
-                    "; ".join(excl["reasons"]),
-                ]
-            )
+        writer.writerows(
+            [
+                excl["filename"],
+                excl["suggested_name"],
+                excl["quality_score"],
+                excl["technical_score"],
+                excl["musical_score"],
+                excl["structure_score"],
+                "Yes" if excl["is_original"] else "No",
+                "; ".join(excl["reasons"]),
+            ]
+            for excl in exclusions
+        )
     print(f"  Exclusions CSV: {exclusions_csv_path}")
 
     # Rename mapping CSV
     rename_csv_path = reports_dir / "rename_mapping.csv"
-    with open(rename_csv_path, "w", encoding="utf-8", newline="") as f:
+    with open_csv_for_writing(rename_csv_path) as f:
         writer = csv.writer(f)
         writer.writerow(["original_filename", "new_filename", "suggested_name", "suggested_id"])
-        for mapping in rename_mapping:
-            writer.writerow(
-                [
-                    mapping["original"],
-                    mapping["new"],
-                    mapping["suggested_name"],
-                    mapping["suggested_id"],
-                ]
-            )
+        writer.writerows(
+            [m["original"], m["new"], m["suggested_name"], m["suggested_id"]]
+            for m in rename_mapping
+        )
     print(f"  Rename mapping CSV: {rename_csv_path}")
 
     # 5. Generate metadata CSV for batch import (ready for reference database)
-    print("\n=== Generating Database Import Metadata ===")
+    start_phase("Generating Database Import Metadata")
 
     # Create metadata CSV for batch import (with all enhanced metadata)
     import_metadata_path = reports_dir / "import_metadata.csv"
-    with open(import_metadata_path, "w", encoding="utf-8", newline="") as f:
-        # Include all enhanced metadata fields for batch import
-        fieldnames = [
-            "filename",
-            "id",
-            "title",
-            "description",
-            "style",
-            "form",
-            "techniques",
-            "detected_key",
-            "tempo_bpm",
-            "duration_beats",
-            "quality_score",
-            "technical_score",
-            "musical_score",
-            "structure_score",
-            "motif_count",
-            "phrase_count",
-            "chord_count",
-            "harmonic_progression",
-            "time_signature",
-            "bars",
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for row in files_for_import:
-            meta = extract_metadata(row)
-            # Use new filename if rename mapping exists
-            filename = next(
-                (m["new"] for m in rename_mapping if m["original"] == row["filename"]),
-                row["filename"],
-            )
-
-            # Limit harmonic progression length
-            harmonic_prog = meta["harmonic_progression"]
-            if harmonic_prog:
-                harmonic_prog = " ".join(harmonic_prog.split()[:10])
+    with open_csv_for_writing(import_metadata_path) as f:
+        # Include all enhanced metadata fields for batch import; rows are positional
+        writer = csv.writer(f)
+        writer.writerow(IMPORT_METADATA_FIELDS)
 
-            writer.writerow(
-                {
-                    "filename": filename,
-                    "id": meta["suggested_id"]
-                    or meta["filename"].replace(".mid", "").replace(".midi", ""),
-                    "title": meta["suggested_name"]
-                    or meta["filename"].replace(".mid", "").replace(".midi", ""),
-                    "description": meta["suggested_description"]
-                    or meta["suggested_name"]
-                    or "Musical composition",
-                    "style": meta["suggested_style"] or "",
-                    "form": meta["detected_form"] or "",
-                    "techniques": "",  # Left empty for manual addition
-                    "detected_key": meta["detected_key"] or "",
-                    "tempo_bpm": f"{meta['tempo_bpm']:.1f}" if meta["tempo_bpm"] else "",
-                    "duration_beats": f"{meta['duration_beats']:.1f}"
-                    if meta["duration_beats"]
-                    else "",
-                    "quality_score": f"{meta['quality_score']:.3f}"
-                    if meta["quality_score"]
-                    else "",
-                    "technical_score": f"{meta['technical_score']:.3f}"
-                    if meta["technical_score"]
-                    else "",
-                    "musical_score": f"{meta['musical_score']:.3f}"
-                    if meta["musical_score"]
-                    else "",
-                    "structure_score": f"{meta['structure_score']:.3f}"
-                    if meta["structure_score"]
-                    else "",
-                    "motif_count": meta["motif_count"] if meta["motif_count"] else "",
-                    "phrase_count": meta["phrase_count"] if meta["phrase_count"] else "",
-                    "chord_count": meta["chord_count"] if meta["chord_count"] else "",
-                    "harmonic_progression": harmonic_prog or "",
-                    "time_signature": meta["time_signature"] or "",
-                    "bars": f"{meta['bars']:.1f}" if meta["bars"] else "",
-                }
-            )
+        # Use new filename if rename mapping exists
+        writer.writerows(
+            import_csv_row(row_import_metadata(row), row.get(NEW_FILENAME, row["filename"]))
+            for row in files_for_import
+        )
 
     print(f"  Import metadata CSV: {import_metadata_path}")
     print(f"  Files ready for import: {len(files_for_import)}")
 
     # 7. Coverage analysis
-    print("\n=== Coverage Analysis ===")
+    start_phase("Coverage Analysis")
+    import_meta = [row_import_metadata(row) for row in files_for_import]
+    quality = np.fromiter(
+        (meta["quality_score"] for meta in import_meta), dtype=np.float64, count=len(import_meta)
+    )
+    # Compare rather than np.digitize so NaN scores still count as low quality
+    high = int(np.count_nonzero(quality >= 0.8))
+    medium = int(np.count_nonzero((quality >= 0.6) & (quality < 0.8)))
     coverage = {
-        "by_style": defaultdict(int),
-        "by_form": defaultdict(int),
-        "by_quality": {"high": 0, "medium": 0, "low": 0},
+        "by_style": dict(Counter(meta["suggested_style"] or "Unknown" for meta in import_meta)),
+        "by_form": dict(Counter(meta["detected_form"] or "Unknown" for meta in import_meta)),
+        "by_quality": {"high": high, "medium": medium, "low": len(import_meta) - high - medium},
     }
 
-    for row in files_for_import:
-        meta = extract_metadata(row)
-        style = meta["suggested_style"] or "Unknown"
-        form = meta["detected_form"] or "Unknown"
-        quality = meta["quality_score"]
-
-        coverage["by_style"][style] += 1
-        coverage["by_form"][form] += 1
-
-        if quality >= 0.8:
-            coverage["by_quality"]["high"] += 1
-        elif quality >= 0.6:
-            coverage["by_quality"]["medium"] += 1
-        else:
-            coverage["by_quality"]["low"] += 1
-
     coverage_report_path = reports_dir / "coverage_analysis.json"
-    with open(coverage_report_path, "w", encoding="utf-8") as f:
-        json.dump(coverage, f, indent=2, ensure_ascii=False)
+    write_json(coverage_report_path, coverage)
     print(f"  Coverage analysis: {coverage_report_path}")
 
     print("\nCoverage Summary:")
     print("  By Style:")
-    for style, count in sorted(coverage["by_style"].items(), key=lambda x: -x[1]):
+    for style, count in sorted(coverage["by_style"].items(), key=itemgetter(1), reverse=True):
         print(f"    {style}: {count}")
     print("  By Form:")
-    for form, count in sorted(coverage["by_form"].items(), key=lambda x: -x[1]):
+    for form, count in sorted(coverage["by_form"].items(), key=itemgetter(1), reverse=True):
         print(f"    {form}: {count}")
     print("  By Quality:")
     for quality, count in coverage["by_quality"].items():
@@ -745,48 +966,104 @@ def main() -> int:
     }
 
     summary_report_path = reports_dir / "normalization_summary.json"
-    with open(summary_report_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    write_json(summary_report_path, summary)
     print(f"\n  Summary JSON: {summary_report_path}")
 
     # Perform renames if not dry-run
     if not args.dry_run:
-        print("\n=== Renaming Files ===")
+        start_phase("Renaming Files")
         renamed_count = 0
         not_found_count = 0
 
-        for mapping in rename_mapping:
-            original_path = args.dir / mapping["original"]
-            new_path = output_dir / mapping["new"]
+        # List each directory once instead of stat-ing every source and target
+        source_listing = DirectoryListing.scan(args.dir)
+        target_listing = (
+            source_listing if output_dir == args.dir else DirectoryListing.scan(output_dir)
+        )
 
-            if not original_path.exists():
-                print(f"  WARNING: File not found: {original_path}")
-                not_found_count += 1
-                continue
+        rename_ops = [
+            (mapping, str(args.dir / mapping["original"]), str(output_dir / mapping["new"]))
+            for mapping in rename_mapping
+        ]
 
+        def rename_file(
+            op: tuple[dict[str, str], str, str], *, live: bool = False
+        ) -> tuple[str, str | None]:
+            """Rename one file, returning its outcome and the line to report (if any)."""
+            mapping, original_path, new_path = op
+            # A path another rename also touches may have changed since the listing, so stat it
+            if not (
+                os.path.exists(original_path)
+                if live
+                else source_listing.contains(mapping["original"])
+            ):
+                return "not_found", f"  WARNING: File not found: {original_path}"
             if original_path == new_path:
-                continue
-
-            if new_path.exists():
-                print(f"  WARNING: Target exists, skipping: {new_path}")
-                continue
-
+                return "unchanged", None
+            if os.path.exists(new_path) if live else target_listing.contains(mapping["new"]):
+                return "skipped", f"  WARNING: Target exists, skipping: {new_path}"
             try:
-                original_path.rename(new_path)
-                print(f"  Renamed: {mapping['original']} -> {mapping['new']}")
-                renamed_count += 1
+                os.rename(original_path, new_path)
             except Exception as e:
-                print(f"  ERROR renaming {mapping['original']}: {e}")
+                return "failed", f"  ERROR renaming {mapping['original']}: {e}"
+            return "renamed", f"  Renamed: {mapping['original']} -> {mapping['new']}"
+
+        # Renames are independent syscalls, so overlap them (this mostly pays off on network
+        # filesystems). A rename that shares a source or target path with any other rename
+        # depends on the order they run in, so those run serially in mapping order. They
+        # touch no path the concurrent ones touch, which keeps the outcome of every rename
+        # the same as a plain serial pass.
+        # Paths are compared with both directories resolved, so an --output-dir spelled
+        # differently from --dir (trailing slash, "./", a symlink) still lines up
+        source_root = args.dir.resolve()
+        target_root = output_dir.resolve()
+        path_keys = [
+            (
+                os.path.join(source_root, mapping["original"]).casefold(),
+                os.path.join(target_root, mapping["new"]).casefold(),
+            )
+            for mapping, _, _ in rename_ops
+        ]
+        path_counts = Counter(path for original, new in path_keys for path in {original, new})
+        ordered = [
+            i
+            for i, (original, new) in enumerate(path_keys)
+            if path_counts[original] > 1 or path_counts[new] > 1
+        ]
+        ordered_set = set(ordered)
+        independent = [i for i in range(len(rename_ops)) if i not in ordered_set]
+        results: list[tuple[str, str | None]] = [("unchanged", None)] * len(rename_ops)
+        if independent:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(args.rename_workers, len(independent)))
+            ) as executor:
+                for i, result in zip(
+                    independent,
+                    executor.map(rename_file, (rename_ops[i] for i in independent)),
+                    strict=True,
+                ):
+                    results[i] = result
+        for i in ordered:
+            results[i] = rename_file(rename_ops[i], live=True)
+
+        # Report in mapping order, as a serial pass would
+        for outcome, line in results:
+            if line is not None:
+                print(line)
+            if outcome == "renamed":
+                renamed_count += 1
+            elif outcome == "not_found":
+                not_found_count += 1
 
         print(f"\nRenamed {renamed_count} files")
         if not_found_count > 0:
             print(f"  {not_found_count} files not found")
     else:
-        print("\n=== DRY RUN - No files renamed ===")
+        start_phase("DRY RUN - No files renamed")
         print(f"Would rename {len(rename_mapping)} files")
 
     # Print summary
-    print("\n=== Summary ===")
+    start_phase("Summary")
     print(f"Total files: {len(rows)}")
     print(f"Duplicate groups: {len(duplicate_groups)}")
     print(f"Files in duplicate groups: {sum(len(g) for g in duplicate_groups.values())}")
@@ -796,6 +1073,7 @@ def main() -> int:
     if rename_conflicts:
         print(f"Rename conflicts: {len(rename_conflicts)}")
 
+    sys.stdout.flush()
     return 0
 
 
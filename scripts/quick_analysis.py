@@ -4,31 +4,43 @@ Quick standalone analysis script for basic MIDI file statistics.
 
 This is a lightweight script that works without full package installation.
 It provides basic metrics (duration, note count, gaps, pitch range) using
-only mido and pydantic.
+only mido, pydantic and numpy.
 
 For comprehensive analysis with musical features (motifs, phrases, harmony),
 use the main CLI `analyze` command or `analyze_dataset.py` script.
 
-Requires: pip install mido pydantic
+Requires: pip install mido pydantic numpy
 
 Usage:
-    python3 scripts/quick_analysis.py <midi_directory> [--output output.json]
+    python3 scripts/quick_analysis.py <midi_directory> [--output output.json] [--workers N]
 """
 
 import json
-import statistics
+import os
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Any
 
 try:
     import mido
+    import numpy as np
     from pydantic import BaseModel
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
-    print("Please install: pip install mido pydantic")
+    print("Please install: pip install mido pydantic numpy")
     sys.exit(1)
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+MIDI_EXTENSIONS = frozenset({".mid", ".midi"})
+USAGE = "Usage: python quick_analysis.py <midi_directory> [--output output.json] [--workers N]"
+
 
 class Distribution(BaseModel):
     """Statistical distribution."""
@@ -41,21 +53,21 @@ class Distribution(BaseModel):
     max: float | None = None
 
 
-def _calculate_distribution(values: list[float]) -> Distribution:
+def _calculate_distribution(values: np.ndarray) -> Distribution:
     """Calculate distribution statistics."""
-    if not values:
+    if not len(values):
         return Distribution()
 
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
+    # Interpolated quantiles (numpy's default linear method), taken in one call
+    q_min, q25, q50, q75, q_max = np.quantile(values, [0.0, 0.25, 0.5, 0.75, 1.0])
 
     return Distribution(
-        min=float(sorted_vals[0]),
-        p25=float(sorted_vals[n // 4]) if n >= 4 else None,
-        median=float(sorted_vals[n // 2]) if n >= 2 else None,
-        mean=float(sum(values) / n),
-        p75=float(sorted_vals[3 * n // 4]) if n >= 4 else None,
-        max=float(sorted_vals[-1]),
+        min=float(q_min),
+        p25=float(q25),
+        median=float(q50),
+        mean=float(values.mean()),
+        p75=float(q75),
+        max=float(q_max),
     )
 
 
@@ -65,75 +77,68 @@ def analyze_single_midi(midi_path: Path) -> dict[str, Any]:
         mid = mido.MidiFile(midi_path)
         ppq = int(mid.ticks_per_beat or 480)
 
-        # Extract notes
-        notes: list[tuple[float, float, int]] = []  # (start_beats, duration_beats, pitch)
+        # Extract notes into flat typed columns (no tuple or float object per note);
+        # ticks are converted to beats for all notes at once afterwards
+        start_ticks = array("q")
+        duration_ticks = array("q")
+        note_pitches = array("h")
         tempo_map: dict[int, float] = {0: 120.0}
 
         for track in mid.tracks:
             abs_tick = 0
-            active_notes: dict[int, tuple[int, int]] = {}  # pitch -> (start_tick, velocity)
+            active_notes: dict[int, int] = {}  # pitch -> start_tick
 
+            # Dispatch on msg.type alone: it already tells meta and channel messages
+            # apart, and the note types carry plain ints when read from a file
             for msg in track:
-                abs_tick += int(msg.time)
+                abs_tick += msg.time
+                msg_type = msg.type
 
-                if isinstance(msg, mido.MetaMessage):
-                    if msg.type == "set_tempo":
-                        tempo_map[abs_tick] = float(mido.tempo2bpm(msg.tempo))
-                    continue
+                if msg_type == "note_on" and msg.velocity > 0:
+                    active_notes[msg.note] = abs_tick
 
-                if not isinstance(msg, mido.Message):
-                    continue
+                elif msg_type in {"note_off", "note_on"}:
+                    start_tick = active_notes.pop(msg.note, None)
+                    if start_tick is not None and abs_tick > start_tick:
+                        start_ticks.append(start_tick)
+                        duration_ticks.append(abs_tick - start_tick)
+                        note_pitches.append(msg.note)
 
-                if msg.type == "note_on" and int(msg.velocity) > 0:
-                    pitch = int(msg.note)
-                    active_notes[pitch] = (abs_tick, int(msg.velocity))
+                elif msg_type == "set_tempo":
+                    tempo_map[abs_tick] = float(mido.tempo2bpm(msg.tempo))
 
-                elif msg.type == "note_off" or (msg.type == "note_on" and int(msg.velocity) == 0):
-                    pitch = int(msg.note)
-                    if pitch in active_notes:
-                        start_tick, _velocity = active_notes.pop(pitch)
-                        duration_ticks = abs_tick - start_tick
-
-                        if duration_ticks > 0:
-                            start_beats = start_tick / ppq
-                            duration_beats = duration_ticks / ppq
-                            notes.append((start_beats, duration_beats, pitch))
-
-        if not notes:
+        note_count = len(start_ticks)
+        if not note_count:
             return {"error": "No notes found", "file": str(midi_path)}
 
-        # Sort by start time
-        notes.sort(key=lambda n: n[0])
+        # Columns of start_beats, duration_beats and pitch, sorted by start time
+        order = np.argsort(np.frombuffer(start_ticks, dtype=np.int64), kind="stable")
+        starts = np.frombuffer(start_ticks, dtype=np.int64)[order] / ppq
+        durations = np.frombuffer(duration_ticks, dtype=np.int64)[order] / ppq
+        pitches = np.frombuffer(note_pitches, dtype=np.int16)
+        ends = starts + durations
 
         # Calculate basic metrics
-        duration_beats = notes[-1][0] + notes[-1][1] - notes[0][0]
+        duration_beats = float(ends[-1] - starts[0])
 
         # Calculate gaps
-        gaps: list[float] = []
-        for i in range(len(notes) - 1):
-            current_end = notes[i][0] + notes[i][1]
-            next_start = notes[i + 1][0]
-            gap = max(0.0, next_start - current_end)
-            gaps.append(gap)
-
-        gap_dist = _calculate_distribution(gaps) if gaps else Distribution()
+        gaps = np.maximum(0.0, starts[1:] - ends[:-1])
+        gap_dist = _calculate_distribution(gaps)
 
         # Note density
-        note_density = len(notes) / duration_beats if duration_beats > 0 else 0
+        note_density = note_count / duration_beats if duration_beats > 0 else 0
 
         # Duration distribution
-        durations = [n[1] for n in notes]
         duration_dist = _calculate_distribution(durations)
 
         # Pitch range
-        pitches = [n[2] for n in notes]
-        pitch_min = min(pitches) if pitches else None
-        pitch_max = max(pitches) if pitches else None
+        pitch_min = int(pitches.min())
+        pitch_max = int(pitches.max())
 
         return {
             "file": midi_path.name,
             "duration_beats": round(duration_beats, 2),
-            "note_count": len(notes),
+            "note_count": note_count,
             "note_density_per_beat": round(note_density, 2),
             "gaps": {
                 "max": round(gap_dist.max or 0, 2),
@@ -155,9 +160,19 @@ def analyze_single_midi(midi_path: Path) -> dict[str, Any]:
         return {"error": str(e), "file": str(midi_path)}
 
 
+def find_midi_files(midi_dir: Path) -> list[Path]:
+    """List .mid/.midi files (any case) in a directory with a single scan."""
+    with os.scandir(midi_dir) as entries:
+        return [
+            Path(e.path)
+            for e in entries
+            if os.path.splitext(e.name)[1].lower() in MIDI_EXTENSIONS and e.is_file()
+        ]
+
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python quick_analysis.py <midi_directory> [--output output.json]")
+        print(USAGE)
         sys.exit(1)
 
     midi_dir = Path(sys.argv[1])
@@ -171,8 +186,23 @@ def main():
         if idx + 1 < len(sys.argv):
             output_file = sys.argv[idx + 1]
 
+    # Files are analyzed independently, so spread them over all cores by default
+    workers = os.cpu_count() or 1
+    if "--workers" in sys.argv:
+        idx = sys.argv.index("--workers")
+        value = sys.argv[idx + 1] if idx + 1 < len(sys.argv) else None
+        if value is None:
+            print("Error: --workers needs a value")
+            print(USAGE)
+            sys.exit(1)
+        if not value.isdigit() or int(value) < 1:
+            print(f"Error: --workers must be a positive integer, got {value!r}")
+            print(USAGE)
+            sys.exit(1)
+        workers = int(value)
+
     # Find MIDI files
-    midi_files = list(midi_dir.glob("*.mid")) + list(midi_dir.glob("*.midi"))
+    midi_files = find_midi_files(midi_dir)
 
     if not midi_files:
         print(f"Error: No MIDI files found in {midi_dir}")
@@ -184,51 +214,61 @@ def main():
     results = []
     errors = []
 
-    for i, midi_file in enumerate(midi_files, 1):
-        print(f"  [{i}/{len(midi_files)}] {midi_file.name}")
-        result = analyze_single_midi(midi_file)
-        if "error" in result:
-            errors.append(result)
+    with ExitStack() as stack:
+        # A pool only pays for its start-up when there's a file for every worker
+        if workers == 1 or len(midi_files) < workers:
+            analyses = map(analyze_single_midi, midi_files)
         else:
-            results.append(result)
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            analyses = executor.map(analyze_single_midi, midi_files, chunksize=16)
+        for i, (midi_file, result) in enumerate(zip(midi_files, analyses, strict=True), 1):
+            print(f"  [{i}/{len(midi_files)}] {midi_file.name}")
+            if "error" in result:
+                errors.append(result)
+            else:
+                results.append(result)
 
     # Aggregate statistics
     if results:
-        durations = [r["duration_beats"] for r in results]
-        max_gaps = [r["gaps"]["max"] for r in results]
-        mean_gaps = [r["gaps"]["mean"] for r in results]
-        note_counts = [r["note_count"] for r in results]
+        # One row per file: duration, max gap, mean gap, note count
+        stats = np.array(
+            [
+                (r["duration_beats"], r["gaps"]["max"], r["gaps"]["mean"], r["note_count"])
+                for r in results
+            ],
+            dtype=np.float64,
+        )
+        means = stats.mean(axis=0)
+        medians = np.median(stats, axis=0)
+        durations = stats[:, 0]
 
         summary = {
             "total_files": len(results),
             "errors": len(errors),
             "duration": {
-                "mean": round(statistics.mean(durations), 2),
-                "median": round(statistics.median(durations), 2),
-                "min": round(min(durations), 2),
-                "max": round(max(durations), 2),
+                "mean": round(float(means[0]), 2),
+                "median": round(float(medians[0]), 2),
+                "min": round(float(durations.min()), 2),
+                "max": round(float(durations.max()), 2),
             },
             "gaps": {
-                "max_gap_mean": round(statistics.mean(max_gaps), 2),
-                "max_gap_median": round(statistics.median(max_gaps), 2),
-                "mean_gap_mean": round(statistics.mean(mean_gaps), 2),
-                "mean_gap_median": round(statistics.median(mean_gaps), 2),
+                "max_gap_mean": round(float(means[1]), 2),
+                "max_gap_median": round(float(medians[1]), 2),
+                "mean_gap_mean": round(float(means[2]), 2),
+                "mean_gap_median": round(float(medians[2]), 2),
             },
             "notes": {
-                "mean": round(statistics.mean(note_counts), 2),
-                "median": round(statistics.median(note_counts), 2),
+                "mean": round(float(means[3]), 2),
+                "median": round(float(medians[3]), 2),
             },
         }
 
-        # Group by length
-        short = [r for r in results if r["duration_beats"] < 64]
-        medium = [r for r in results if 64 <= r["duration_beats"] < 200]
-        long_pieces = [r for r in results if r["duration_beats"] >= 200]
-
+        # Group by length: the split points of the sorted durations give the bucket sizes
+        short_end, medium_end = np.searchsorted(np.sort(durations), [64, 200])
         summary["by_length"] = {
-            "short_<64_beats": len(short),
-            "medium_64-200_beats": len(medium),
-            "long_>=200_beats": len(long_pieces),
+            "short_<64_beats": int(short_end),
+            "medium_64-200_beats": int(medium_end - short_end),
+            "long_>=200_beats": int(len(durations) - medium_end),
         }
 
         output = {
@@ -240,8 +280,12 @@ def main():
         output = {"error": "No valid files analyzed", "errors": errors}
 
     # Save results
-    with open(output_file, "w") as f:
-        json.dump(output, f, indent=2)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(output_file, "w") as f:
+            f.write(json.dumps(output, indent=2))
 
     print(f"\nResults saved to {output_file}")
     print("\nSummary:")
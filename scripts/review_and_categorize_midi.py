@@ -31,6 +31,9 @@ Usage:
     # Review with duplicate detection threshold
     python3 scripts/review_and_categorize_midi.py --dir references/ --similarity-threshold 0.7
 
+    # Analyze files on 8 worker processes
+    python3 scripts/review_and_categorize_midi.py --dir references/ --workers 8 --output review_report.csv
+
     # Clear cache and start fresh
     python3 scripts/review_and_categorize_midi.py --dir references/ --clear-cache --output review_report.csv
 """
@@ -47,10 +50,14 @@ import sys
 import time
 import warnings
 from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+import mido
+import numpy as np
+
 # Suppress PedalEvent warnings from iterate.py (they're informational, not errors)
 # These warnings occur when MIDI files have pedal events with duration=0
 # We suppress them to reduce output clutter during batch processing
@@ -60,6 +67,7 @@ warnings.filterwarnings("ignore", category=UserWarning, module="pianist.iterate"
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from pianist.analyze import find_midi_files
 from pianist.comprehensive_analysis import analyze_for_user
 from pianist.iterate import composition_from_midi
 
@@ -392,6 +400,104 @@ def calculate_similarity(
     return 0.0
 
 
+def _key_base(key: str) -> str:
+    """Tonic of a detected key such as "C major" (the whole string if it has no mode)."""
+    return key.split(maxsplit=1)[0] if " " in key else key
+
+
+class SimilarityFeatures:
+    """
+    Similarity inputs for a batch of files, laid out as arrays.
+
+    Comparing one file against many is then a handful of array operations instead of
+    a calculate_similarity() call per pair. Scores are accumulated in the same order
+    as calculate_similarity(), so they are identical to it.
+    """
+
+    def __init__(self, metadata: list[FileMetadata], signatures: list[list[int]]) -> None:
+        n = len(metadata)
+        token_ids: dict[str, int] = {"": 0}  # Shared ids for keys, tonics, forms and chords
+
+        def token(value: str) -> int:
+            return token_ids.setdefault(value, len(token_ids))
+
+        self.key = np.array([token(m.detected_key or "") for m in metadata], dtype=np.int64)
+        self.key_base = np.array(
+            [token(_key_base(m.detected_key)) if m.detected_key else 0 for m in metadata],
+            dtype=np.int64,
+        )
+        self.form = np.array([token(m.detected_form or "") for m in metadata], dtype=np.int64)
+
+        # First 10 chords of each progression, padded with -1
+        self.has_progression = np.array([bool(m.harmonic_progression) for m in metadata])
+        self.progression = np.full((n, 10), -1, dtype=np.int64)
+        self.progression_len = np.zeros(n, dtype=np.int64)
+        for i, meta in enumerate(metadata):
+            if meta.harmonic_progression:
+                chords = meta.harmonic_progression.split()[:10]
+                self.progression[i, : len(chords)] = [token(c) for c in chords]
+                self.progression_len[i] = len(chords)
+
+        # Melodic signatures relative to their first pitch (how calculate_similarity aligns them)
+        self.melody_len = np.array([len(sig) for sig in signatures], dtype=np.int64)
+        self.melody = np.zeros((n, int(self.melody_len.max(initial=0))), dtype=np.int64)
+        for i, sig in enumerate(signatures):
+            if sig:
+                self.melody[i, : len(sig)] = np.asarray(sig, dtype=np.int64) - sig[0]
+
+        self.duration = np.array([m.duration_beats for m in metadata], dtype=np.float64)
+
+    def against(self, i: int, others: np.ndarray) -> np.ndarray:
+        """Similarity of file ``i`` to each file in ``others`` (as calculate_similarity)."""
+        zeros = np.zeros(len(others))
+        score = zeros.copy()
+        factors = zeros.copy()
+
+        # Key signature match (0.3 weight)
+        both = (self.key[i] != 0) & (self.key[others] != 0)
+        score += np.where(both & (self.key[others] == self.key[i]), 0.3, 0.0)
+        score += np.where(both & (self.key_base[others] == self.key_base[i]), 0.15, 0.0)
+        factors += np.where(both, 0.3, 0.0)
+
+        # Form match (0.2 weight)
+        both = (self.form[i] != 0) & (self.form[others] != 0)
+        score += np.where(both & (self.form[others] == self.form[i]), 0.2, 0.0)
+        factors += np.where(both, 0.2, 0.0)
+
+        # Harmonic progression similarity (0.2 weight)
+        both = self.has_progression[i] & self.has_progression[others]
+        len_i = self.progression_len[i]
+        len_o = self.progression_len[others]
+        compared = np.arange(10) < np.minimum(len_i, len_o)[:, None]
+        matches = ((self.progression[others] == self.progression[i]) & compared).sum(axis=1)
+        similarity = matches / np.maximum(np.maximum(len_i, len_o), 1)
+        score += np.where(both & (len_i > 0) & (len_o > 0), 0.2 * similarity, 0.0)
+        factors += np.where(both, 0.2, 0.0)
+
+        # Melodic signature similarity (0.2 weight)
+        len_i = self.melody_len[i]
+        len_o = self.melody_len[others]
+        both = (len_i > 0) & (len_o > 0)
+        min_len = np.minimum(len_i, len_o)
+        compared = np.arange(self.melody.shape[1]) < min_len[:, None]
+        matches = ((self.melody[others] == self.melody[i]) & compared).sum(axis=1)
+        similarity = matches / np.maximum(min_len, 1)
+        score += np.where(both & (min_len >= 5), 0.2 * similarity, 0.0)
+        factors += np.where(both, 0.2, 0.0)
+
+        # Duration similarity (0.1 weight)
+        dur_i = self.duration[i]
+        dur_o = self.duration[others]
+        both = (dur_i > 0) & (dur_o > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.minimum(dur_i, dur_o) / np.maximum(dur_i, dur_o)
+        score += np.where(both, 0.1 * ratio, 0.0)
+        factors += np.where(both, 0.1, 0.0)
+
+        # Normalize by factors used
+        return np.divide(score, factors, out=zeros, where=factors > 0)
+
+
 def call_ollama(model: str, prompt: str, verbose: bool = False) -> str:
     """
     Call a local Ollama model.
@@ -1238,19 +1344,16 @@ def load_metadata_json(file_path: Path) -> dict[str, Any] | None:
     """
     json_path = file_path.with_suffix(file_path.suffix + ".json")
 
-    if json_path.exists():
-        try:
-            with open(json_path, encoding="utf-8") as f:
-                metadata = json.load(f)
-                return metadata
-        except json.JSONDecodeError as e:
-            print(f"Warning: Invalid JSON in {json_path}: {e}", file=sys.stderr)
-            return None
-        except Exception as e:
-            print(f"Warning: Could not load metadata from {json_path}: {e}", file=sys.stderr)
-            return None
-
-    return None
+    try:
+        return json.loads(json_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as e:
+        print(f"Warning: Invalid JSON in {json_path}: {e}", file=sys.stderr)
+        return None
+    except Exception as e:
+        print(f"Warning: Could not load metadata from {json_path}: {e}", file=sys.stderr)
+        return None
 
 
 def extract_composer_from_directory(file_path: Path) -> str | None:
@@ -2130,7 +2233,13 @@ def analyze_file(
         print(f"  [Analyze] Starting analysis of {file_path.name}...", file=sys.stderr)
         sys.stderr.flush()
 
-    # Load composition ONCE and reuse it everywhere (major performance improvement for large files)
+    # Parse the MIDI file and load the composition ONCE and reuse them everywhere
+    # (major performance improvement for large files)
+    try:
+        midi: mido.MidiFile | None = mido.MidiFile(file_path)
+    except Exception:
+        # Let the analysis steps below report the unreadable file as they did before
+        midi = None
     composition = None
     melodic_signature: list[int] = []
 
@@ -2140,7 +2249,7 @@ def analyze_file(
                 print("  [Analyze] Loading composition from MIDI...", file=sys.stderr)
                 sys.stderr.flush()
                 load_start = time.time()
-            composition = composition_from_midi(file_path)
+            composition = composition_from_midi(file_path, midi=midi)
             if verbose:
                 print(
                     f"  [Timing] Load composition from MIDI: {time.time() - load_start:.2f}s",
@@ -2180,6 +2289,7 @@ def analyze_file(
         ai_model=ai_model,
         composition=composition,  # Reuse loaded composition
         verbose=verbose,
+        midi=midi,
     )
     if verbose:
         print(
@@ -2206,6 +2316,7 @@ def analyze_file(
         model=ai_model,
         composition=composition,
         musical_analysis=musical_analysis,
+        midi=midi,
     )
     if verbose:
         print(f"  [Timing] Quality check: {time.time() - quality_start:.2f}s", file=sys.stderr)
@@ -2631,6 +2742,20 @@ def analyze_file(
     return metadata, melodic_signature, ai_attempted, ai_identified
 
 
+def timed_analyze_file(
+    file_path: Path, **kwargs: Any
+) -> tuple[tuple[FileMetadata, list[int], bool, bool], float]:
+    """
+    Run analyze_file and also return how long it took, measured where it ran.
+
+    Returns:
+        Tuple of (analyze_file result, elapsed seconds)
+    """
+    start_time = time.time()
+    result = analyze_file(file_path, **kwargs)
+    return result, time.time() - start_time
+
+
 def retry_ai_naming_only(
     file_path: Path,
     cached_metadata: FileMetadata,
@@ -2829,26 +2954,29 @@ def detect_duplicates(
     For incremental detection, use detect_duplicates_incremental instead.
     Checks metadata to avoid false positives (different pieces that are musically similar).
     """
-    # Compare all pairs
-    for i, (meta1, sig1) in enumerate(zip(all_metadata, all_signatures, strict=False)):
-        for j, (meta2, sig2) in enumerate(zip(all_metadata, all_signatures, strict=False)):
-            if i >= j:
-                continue
-
-            similarity = calculate_similarity(meta1, meta2, sig1, sig2)
+    # Compare all pairs, one file against all later files at a time
+    n = min(len(all_metadata), len(all_signatures))
+    features = SimilarityFeatures(all_metadata[:n], all_signatures[:n])
+    for i in range(n - 1):
+        meta1 = all_metadata[i]
+        others = np.arange(i + 1, n)
+        similarities = features.against(i, others)
+
+        for k in np.flatnonzero(similarities >= similarity_threshold):
+            meta2 = all_metadata[int(others[k])]
+            similarity = float(similarities[k])
 
-            if similarity >= similarity_threshold:
-                # Check if they're actually different pieces before marking as duplicates
-                name1 = meta1.suggested_name or ""
-                name2 = meta2.suggested_name or ""
-                if are_different_pieces(name1, name2):
-                    # Musically similar but different pieces - don't mark as duplicates
-                    continue
+            # Check if they're actually different pieces before marking as duplicates
+            name1 = meta1.suggested_name or ""
+            name2 = meta2.suggested_name or ""
+            if are_different_pieces(name1, name2):
+                # Musically similar but different pieces - don't mark as duplicates
+                continue
 
-                meta1.similar_files.append(meta2.filename)
-                meta1.similarity_scores[meta2.filename] = similarity
-                meta2.similar_files.append(meta1.filename)
-                meta2.similarity_scores[meta1.filename] = similarity
+            meta1.similar_files.append(meta2.filename)
+            meta1.similarity_scores[meta2.filename] = similarity
+            meta2.similar_files.append(meta1.filename)
+            meta2.similarity_scores[meta1.filename] = similarity
 
     # Assign duplicate groups
     assign_duplicate_groups(all_metadata)
@@ -3136,8 +3264,8 @@ def write_json_report(
         "files": [asdict(meta) for meta in all_metadata],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Encode the whole report up front so it goes out in one write
+    output_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
 def format_elapsed_time(seconds: float) -> str:
@@ -3188,8 +3316,7 @@ def save_file_result(
         "ai_identified": ai_identified,
     }
 
-    with open(result_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    result_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
 def load_file_result(
@@ -3209,8 +3336,7 @@ def load_file_result(
         return None
 
     try:
-        with open(result_file, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(result_file.read_bytes())
 
         # Reconstruct metadata
         metadata_dict = data["metadata"]
@@ -3240,8 +3366,7 @@ def load_all_results(temp_dir: Path) -> tuple[list[FileMetadata], list[list[int]
     # Load all JSON files
     for result_file in temp_dir.glob("*.json"):
         try:
-            with open(result_file, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(result_file.read_bytes())
 
             metadata_dict = data["metadata"]
             # Handle backward compatibility: if is_original field is missing, auto-detect from filename
@@ -3385,6 +3510,17 @@ def main() -> int:
         help="Minimum quality score to keep when filtering (default: 0.0 = no quality filtering)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of worker processes for file analysis (default: 1, in-process). "
+            "Each worker waits --ai-delay times the worker count between its AI calls, "
+            "so the combined AI request rate stays about one per --ai-delay seconds."
+        ),
+    )
+
     args = parser.parse_args()
 
     # Set up temp directory
@@ -3396,15 +3532,12 @@ def main() -> int:
         sys.stdout.flush()
         clear_temp_results(temp_dir)
 
-    # Find MIDI files
-    files = list(args.dir.glob(args.pattern)) + list(args.dir.glob("*.midi"))
+    # Find MIDI files, sorted by size (smallest to largest) for consistent ordering
+    files = find_midi_files(args.dir, args.pattern, by_size=True)
     if not files:
         print(f"Error: No MIDI files found in {args.dir}", file=sys.stderr)
         return 1
 
-    # Sort files by size (smallest to largest) for consistent ordering
-    files = sorted(files, key=lambda f: f.stat().st_size)
-
     # Apply limit for testing
     if args.limit:
         files = files[: args.limit]
@@ -3477,6 +3610,35 @@ def main() -> int:
     analyzed_count = 0
     skipped_count = 0
 
+    # Get provider and model from args or config
+    from pianist.ai_providers import get_default_model
+
+    ai_provider = args.ai_provider or get_ai_provider()
+    ai_model = args.ai_model or get_ai_model(ai_provider) or get_default_model(ai_provider)
+    ai_delay = args.ai_delay if args.ai_delay is not None else get_ai_delay()
+    analyze_kwargs = {
+        "verbose": args.verbose,
+        "ai_provider": ai_provider,
+        "ai_model": ai_model,
+        "ai_delay": ai_delay,
+        "mark_original": args.mark_original,
+    }
+
+    # With --workers, every file that isn't cached is analyzed up front on a process
+    # pool; results are still consumed (and saved to the cache) in file order below,
+    # so incremental duplicate detection sees files in the same order as a serial run
+    executor: ProcessPoolExecutor | None = None
+    pending: dict[str, Future[tuple[tuple[FileMetadata, list[int], bool, bool], float]]] = {}
+    if args.workers > 1:
+        # Workers make AI calls concurrently, so stretch each worker's delay to keep
+        # the overall request rate what --ai-delay asks for
+        worker_kwargs = {**analyze_kwargs, "ai_delay": ai_delay * args.workers}
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+        for file_path in files:
+            file_str = str(file_path)
+            if not (args.resume and file_str in existing_results):
+                pending[file_str] = executor.submit(timed_analyze_file, file_path, **worker_kwargs)
+
     for i, file_path in enumerate(files, 1):
         file_str = str(file_path)
 
@@ -3502,28 +3664,15 @@ def main() -> int:
         sys.stdout.flush()
 
         try:
-            start_time = time.time()
-
-            # Get provider and model from args or config
-            from pianist.ai_providers import get_default_model
-            from pianist.config import get_ai_model, get_ai_provider
-
-            ai_provider = args.ai_provider or get_ai_provider()
-            ai_model = args.ai_model or get_ai_model(ai_provider) or get_default_model(ai_provider)
-            ai_delay = args.ai_delay if args.ai_delay is not None else get_ai_delay()
-
-            # Run analysis with AI (always used)
-            metadata, signature, ai_attempted, ai_identified = analyze_file(
-                file_path,
-                verbose=args.verbose,
-                ai_provider=ai_provider,
-                ai_model=ai_model,
-                ai_delay=ai_delay,
-                mark_original=args.mark_original,
+            # Run analysis with AI (always used); the time is measured in the worker, not
+            # spent waiting here for its result
+            future = pending.pop(file_str, None)
+            (metadata, signature, ai_attempted, ai_identified), elapsed_time = (
+                future.result()
+                if future is not None
+                else timed_analyze_file(file_path, **analyze_kwargs)
             )
 
-            elapsed_time = time.time() - start_time
-
             if args.verbose:
                 print(f"  Processing time: {format_elapsed_time(elapsed_time)}", file=sys.stderr)
 
@@ -3553,6 +3702,8 @@ def main() -> int:
 
             analyzed_count += 1
         except KeyboardInterrupt:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
             print(
                 f"\n\nInterrupted! Progress saved. {analyzed_count} files analyzed, {skipped_count} skipped."
             )
@@ -3580,6 +3731,9 @@ def main() -> int:
                 traceback.print_exc()
             continue
 
+    if executor is not None:
+        executor.shutdown()
+
     print("\nAnalysis complete:")
     print(f"  Analyzed: {analyzed_count} new files")
     print(f"  Skipped: {skipped_count} previously analyzed files")
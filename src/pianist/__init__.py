@@ -23,6 +23,7 @@ __all__ = [
     "composition_to_canonical_json",
     "iteration_prompt_template",
     # parsing
+    "parse_composition_from_bytes",
     "parse_composition_from_text",
     "transpose_composition",
     "validate_composition_dict",
@@ -41,7 +42,7 @@ from .iterate import (
     iteration_prompt_template,
     transpose_composition,
 )
-from .parser import parse_composition_from_text
+from .parser import parse_composition_from_bytes, parse_composition_from_text
 from .schema import (
     Composition,
     Event,
@@ -4,6 +4,7 @@ import os
 import sys
 import time
 from pathlib import Path
+from typing import Any
 
 # Try to load .env file if python-dotenv is available
 try:
@@ -39,7 +40,9 @@ class OpenRouterError(RuntimeError):
     pass
 
 
-def generate_text(*, model: str, prompt: str, verbose: bool = False) -> str:
+def generate_text(
+    *, model: str, prompt: str, verbose: bool = False, client: Any | None = None
+) -> str:
     """
     Generate text using Google Gemini via the Google GenAI SDK.
 
@@ -56,6 +59,7 @@ def generate_text(*, model: str, prompt: str, verbose: bool = False) -> str:
         model: The Gemini model name (e.g., "gemini-flash-latest").
         prompt: The prompt text to send to Gemini.
         verbose: If True, print progress indicators and timing information.
+        client: Optional `genai.Client` to reuse instead of creating one per call.
 
     Returns:
         The generated text response from Gemini.
@@ -105,7 +109,8 @@ def generate_text(*, model: str, prompt: str, verbose: bool = False) -> str:
         # The client reads API key from env automatically (quickstart behavior).
         # The SDK checks GEMINI_API_KEY first, then GOOGLE_API_KEY.
         # We've already validated that at least one is set above.
-        client = genai.Client()
+        if client is None:
+            client = genai.Client()
 
         # Try streaming first to get partial responses, fallback to non-streaming if not supported
         try:
@@ -178,7 +183,9 @@ def generate_text(*, model: str, prompt: str, verbose: bool = False) -> str:
         raise GeminiError(error_msg) from e
 
 
-def generate_text_ollama(*, model: str, prompt: str, verbose: bool = False) -> str:
+def generate_text_ollama(
+    *, model: str, prompt: str, verbose: bool = False, session: Any | None = None
+) -> str:
     """
     Generate text using a local Ollama model.
 
@@ -189,6 +196,7 @@ def generate_text_ollama(*, model: str, prompt: str, verbose: bool = False) -> s
         model: The Ollama model name (e.g., "gpt-oss:20b", "gemma3:4b", "deepseek-r1:8b").
         prompt: The prompt text to send to Ollama.
         verbose: If True, print progress indicators and timing information.
+        session: Optional `requests.Session` to reuse pooled connections across calls.
 
     Returns:
         The generated text response from Ollama.
@@ -212,7 +220,8 @@ def generate_text_ollama(*, model: str, prompt: str, verbose: bool = False) -> s
     start_time = time.time()
 
     try:
-        response = requests.post(
+        http = session if session is not None else requests
+        response = http.post(
             f"{ollama_url}/api/generate",
             json={
                 "model": model,
@@ -258,7 +267,9 @@ def generate_text_ollama(*, model: str, prompt: str, verbose: bool = False) -> s
         raise OllamaError(error_msg) from e
 
 
-def generate_text_openrouter(*, model: str, prompt: str, verbose: bool = False) -> str:
+def generate_text_openrouter(
+    *, model: str, prompt: str, verbose: bool = False, session: Any | None = None
+) -> str:
     """
     Generate text using OpenRouter API.
 
@@ -269,6 +280,8 @@ def generate_text_openrouter(*, model: str, prompt: str, verbose: bool = False)
         model: The OpenRouter model identifier. Free options: "mistralai/devstral-2512:free" (recommended), "xiaomi/mimo-v2-flash:free", "tngtech/deepseek-r1t2-chimera:free", "nex-agi/deepseek-v3.1-nex-n1:free". Paid options: "openai/gpt-4o", "anthropic/claude-3.5-sonnet", etc.
         prompt: The prompt text to send to the model.
         verbose: If True, print progress indicators and timing information.
+        session: Optional `requests.Session` to reuse pooled (keep-alive) connections
+            across calls instead of a new TLS handshake per request.
 
     Returns:
         The generated text response from OpenRouter.
@@ -321,7 +334,8 @@ def generate_text_openrouter(*, model: str, prompt: str, verbose: bool = False)
             "messages": [{"role": "user", "content": prompt}],
         }
 
-        response = requests.post(
+        http = session if session is not None else requests
+        response = http.post(
             url,
             headers=headers,
             json=payload,
@@ -398,7 +412,45 @@ def get_default_model(provider: str) -> str:
         )
 
 
-def generate_text_unified(*, provider: str, model: str, prompt: str, verbose: bool = False) -> str:
+def create_client(provider: str, *, pool_size: int = 1) -> Any | None:
+    """Create a reusable client for a provider, to pass to `generate_text_unified`.
+
+    Returns a `genai.Client` for Gemini and a `requests.Session` (with a connection
+    pool of `pool_size`) for Ollama and OpenRouter, so repeated calls skip client
+    setup and reuse keep-alive connections. Returns None when the provider's
+    dependencies or credentials are missing; the generate call then reports the error.
+    """
+    if provider == "gemini":
+        if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
+            return None
+        try:
+            from google import genai  # type: ignore
+
+            return genai.Client()
+        except Exception:
+            return None
+    if provider in ("ollama", "openrouter"):
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            return None
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    raise ValueError(f"Unsupported provider: {provider}. Use 'gemini', 'ollama', or 'openrouter'.")
+
+
+def generate_text_unified(
+    *,
+    provider: str,
+    model: str,
+    prompt: str,
+    verbose: bool = False,
+    client: Any | None = None,
+) -> str:
     """
     Unified interface for generating text from Gemini, Ollama, or OpenRouter.
 
@@ -407,6 +459,7 @@ def generate_text_unified(*, provider: str, model: str, prompt: str, verbose: bo
         model: Model name (provider-specific)
         prompt: The prompt text
         verbose: If True, print progress indicators
+        client: Optional client from `create_client(provider)` to reuse across calls
 
     Returns:
         Generated text response
@@ -418,11 +471,11 @@ def generate_text_unified(*, provider: str, model: str, prompt: str, verbose: bo
         ValueError: For unsupported providers
     """
     if provider == "gemini":
-        return generate_text(model=model, prompt=prompt, verbose=verbose)
+        return generate_text(model=model, prompt=prompt, verbose=verbose, client=client)
     elif provider == "ollama":
-        return generate_text_ollama(model=model, prompt=prompt, verbose=verbose)
+        return generate_text_ollama(model=model, prompt=prompt, verbose=verbose, session=client)
     elif provider == "openrouter":
-        return generate_text_openrouter(model=model, prompt=prompt, verbose=verbose)
+        return generate_text_openrouter(model=model, prompt=prompt, verbose=verbose, session=client)
     else:
         raise ValueError(
             f"Unsupported provider: {provider}. Use 'gemini', 'ollama', or 'openrouter'."
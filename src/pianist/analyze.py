@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import fnmatch
 import itertools
 import json
 import math
+import os
 import statistics
 from collections import Counter, defaultdict
 from dataclasses import dataclass
@@ -13,7 +15,7 @@ import mido
 from pydantic import BaseModel, Field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RawNote:
     channel: int
     start_tick: int
@@ -22,7 +24,7 @@ class _RawNote:
     velocity: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RawPedal:
     channel: int
     start_tick: int
@@ -180,12 +182,49 @@ class MidiAnalysis(BaseModel):
         return json.dumps(payload, indent=2, sort_keys=True) + "\n"
 
 
-def analyze_midi(path: str | Path) -> MidiAnalysis:
+def find_midi_files(
+    directory: str | Path, pattern: str = "*.mid", *, by_size: bool = False
+) -> list[Path]:
+    """
+    List the files in a directory matching a glob pattern, plus any ``*.midi`` files.
+
+    A file matching both is listed once. A plain name pattern is matched in a
+    single directory scan, which also yields the sizes; patterns with a path part
+    (``sub/*.mid``, ``**/*.mid``) go through ``Path.glob``. Files come back in path
+    order, or smallest first with `by_size`.
+    """
+    directory = Path(directory)
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        paths = [
+            path
+            for path in dict.fromkeys([*directory.glob(pattern), *directory.glob("*.midi")])
+            if path.is_file()
+        ]
+        return (
+            sorted(paths, key=lambda path: (path.stat().st_size, path))
+            if by_size
+            else sorted(paths)
+        )
+
+    with os.scandir(directory) as entries:
+        found = [
+            (e.stat().st_size if by_size else 0, Path(e.path))
+            for e in entries
+            if (fnmatch.fnmatch(e.name, pattern) or fnmatch.fnmatch(e.name, "*.midi"))
+            and e.is_file()
+        ]
+    return [path for _, path in sorted(found)]
+
+
+def analyze_midi(path: str | Path, midi: mido.MidiFile | None = None) -> MidiAnalysis:
     """
     Analyze a MIDI file and return prompt-friendly statistics.
+
+    Pass `midi` to reuse a file the caller has already parsed; `path` is then
+    only recorded as the source path.
     """
     path = Path(path)
-    mid = mido.MidiFile(path)
+    mid = mido.MidiFile(path) if midi is None else midi
     ppq = int(mid.ticks_per_beat or 480)
 
     tempo_by_tick: dict[int, float] = {}
@@ -452,45 +452,37 @@ def analyze_composition_metrics(midi_path: str | Path) -> CompositionMetrics:
 
     for track in mid.tracks:
         abs_tick = 0
-        active_notes: dict[
-            int, tuple[int, int, int]
-        ] = {}  # pitch -> (start_tick, velocity, channel)
+        active_notes: dict[int, tuple[int, int]] = {}  # pitch -> (start_tick, velocity)
 
+        # Dispatch on msg.type alone: it already tells meta and channel messages
+        # apart, and messages read from a file carry plain ints
         for msg in track:
-            abs_tick += int(msg.time)
+            abs_tick += msg.time
+            msg_type = msg.type
 
-            if isinstance(msg, mido.MetaMessage):
-                if msg.type == "set_tempo":
-                    tempo_map[abs_tick] = float(mido.tempo2bpm(msg.tempo))
-                continue
+            if msg_type == "note_on" and msg.velocity > 0:
+                active_notes[msg.note] = (abs_tick, msg.velocity)
 
-            if not isinstance(msg, mido.Message):
-                continue
-
-            if msg.type == "note_on" and int(msg.velocity) > 0:
-                pitch = int(msg.note)
-                active_notes[pitch] = (abs_tick, int(msg.velocity), int(getattr(msg, "channel", 0)))
-
-            elif msg.type == "note_off" or (msg.type == "note_on" and int(msg.velocity) == 0):
-                pitch = int(msg.note)
-                if pitch in active_notes:
-                    start_tick, velocity, _channel = active_notes.pop(pitch)
+            elif msg_type in {"note_off", "note_on"}:
+                started = active_notes.pop(msg.note, None)
+                if started is not None:
+                    start_tick, velocity = started
                     duration_ticks = abs_tick - start_tick
 
                     if duration_ticks > 0:
                         # Convert to beats
-                        start_beats = start_tick / ppq
-                        duration_beats = duration_ticks / ppq
-
                         notes.append(
                             _NoteEvent(
-                                start_beats=start_beats,
-                                duration_beats=duration_beats,
-                                pitch=pitch,
+                                start_beats=start_tick / ppq,
+                                duration_beats=duration_ticks / ppq,
+                                pitch=msg.note,
                                 velocity=velocity,
                             )
                         )
 
+            elif msg_type == "set_tempo":
+                tempo_map[abs_tick] = float(mido.tempo2bpm(msg.tempo))
+
     if not notes:
         return CompositionMetrics(
             source_path=str(path),
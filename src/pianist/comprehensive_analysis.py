@@ -26,6 +26,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+import mido
+
 from .analyze import analyze_midi
 from .iterate import composition_from_midi
 from .musical_analysis import MUSIC21_AVAILABLE, analyze_composition
@@ -377,6 +379,8 @@ def analyze_for_user(
     ai_model: str | None = None,
     composition: Any | None = None,
     verbose: bool = False,
+    *,
+    midi: mido.MidiFile | None = None,
 ) -> dict[str, Any]:
     """
     Perform user-focused comprehensive analysis of a MIDI or JSON file.
@@ -396,6 +400,8 @@ def analyze_for_user(
         file_path: Path to MIDI (.mid/.midi) or JSON (.json) file
         ai_provider: AI provider for insights ("gemini", "ollama", "openrouter")
         ai_model: Model name (defaults based on provider)
+        midi: Optional already-parsed MIDI file; it is read by the analysis,
+            composition import and quality check instead of parsing the file again
 
     Returns:
         Dictionary with comprehensive analysis results
@@ -415,8 +421,12 @@ def analyze_for_user(
 
     # Handle MIDI files
     if suffix in (".mid", ".midi"):
+        # Parse the file once; analysis, composition import and quality check share it
+        if midi is None:
+            midi = mido.MidiFile(file_path)
+
         # Basic MIDI analysis
-        midi_analysis = analyze_midi(file_path)
+        midi_analysis = analyze_midi(file_path, midi)
 
         # Extract technical metadata
         result["technical"] = extract_technical_metadata(midi_analysis)
@@ -428,7 +438,7 @@ def analyze_for_user(
                 # Use provided composition if available, otherwise load it
                 if composition is None:
                     load_start = time.time()
-                    composition = composition_from_midi(file_path)
+                    composition = composition_from_midi(file_path, midi=midi)
                     load_time = time.time() - load_start
                     if verbose:
                         print(f"  [Timing] Load MIDI: {load_time:.2f}s", file=sys.stderr)
@@ -472,6 +482,7 @@ def analyze_for_user(
             model=ai_model,
             composition=composition,
             musical_analysis=musical_analysis,
+            midi=midi,
         )
 
         # Quality scores
@@ -492,7 +503,7 @@ def analyze_for_user(
 
         # AI insights
         if composition is None:
-            composition = composition_from_midi(file_path)
+            composition = composition_from_midi(file_path, midi=midi)
         ai_insights = _generate_ai_insights(
             composition, file_path, result, ai_provider, ai_model, verbose
         )
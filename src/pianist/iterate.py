@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import json
 from collections import defaultdict
 from dataclasses import dataclass
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RawNote:
     channel: int
     start_tick: int
@@ -29,7 +30,7 @@ class _RawNote:
     velocity: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RawPedal:
     channel: int
     start_tick: int
@@ -55,14 +56,46 @@ def composition_to_canonical_json(comp: Composition) -> str:
     return json.dumps(payload, indent=2, sort_keys=True) + "\n"
 
 
-def composition_from_midi(path: Path) -> Composition:
+def composition_to_canonical_json_prefix(comp: Composition, max_chars: int) -> str:
+    """
+    Return the first `max_chars` characters of `composition_to_canonical_json(comp)`.
+
+    Encoding stops once enough text has been produced, so previews of large
+    compositions don't build the whole JSON string.
+    """
+    payload = comp.model_dump(mode="json", exclude_none=True)
+    encoder = json.JSONEncoder(indent=2, sort_keys=True)
+    chunks: list[str] = []
+    size = 0
+    for chunk in encoder.iterencode(payload):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_chars:
+            break
+    else:
+        chunks.append("\n")
+    return "".join(chunks)[:max_chars]
+
+
+def composition_from_midi(
+    path: Path, data: bytes | None = None, *, midi: mido.MidiFile | None = None
+) -> Composition:
     """
     Best-effort MIDI -> Composition import.
 
     This is intended to support iteration workflows (tweak, re-render, feed back into an LLM).
     It does not attempt to infer hands/voices; it uses legacy `pitches` for safety.
+
+    If `data` holds the file's bytes (already read by the caller), or `midi` the
+    already-parsed file, `path` is only used for the title and the file is not
+    read again.
     """
-    mid = mido.MidiFile(path)
+    if midi is not None:
+        mid = midi
+    elif data is not None:
+        mid = mido.MidiFile(file=io.BytesIO(data))
+    else:
+        mid = mido.MidiFile(path)
     ppq = int(mid.ticks_per_beat or 480)
 
     # Defaults if the MIDI does not contain metadata.
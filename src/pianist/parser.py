@@ -3,12 +3,25 @@ from __future__ import annotations
 import copy
 import json
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from json_repair import repair_json
 
 from .schema import Composition, validate_composition_dict
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_loads_json_bytes: Callable[[bytes], Any]
+
+# orjson is an optional, faster decoder for well-formed JSON files
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+
+    _loads_json_bytes = orjson.loads
+except ImportError:
+    _loads_json_bytes = json.loads
+
 _FENCED_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```", re.IGNORECASE | re.MULTILINE)
 
 
@@ -138,3 +151,20 @@ def parse_composition_from_text(text: str) -> Composition:
     # Normalize timing units (fix cases where model outputs ticks instead of beats)
     data = _normalize_timing_units(data)
     return validate_composition_dict(data)
+
+
+def parse_composition_from_bytes(data: bytes) -> Composition:
+    """
+    Parse a Composition from the raw bytes of a JSON file.
+
+    Well-formed JSON is decoded directly from bytes (with orjson when it is
+    installed), skipping the text extraction used for model output; anything
+    else falls back to parse_composition_from_text.
+    """
+    try:
+        obj = _loads_json_bytes(data)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        obj = None
+    if not isinstance(obj, dict):
+        return parse_composition_from_text(data.decode("utf-8"))
+    return validate_composition_dict(_normalize_timing_units(obj))
@@ -9,50 +9,82 @@ This module provides quality checking functionality used by:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-from .analyze import analyze_midi
-from .iterate import composition_from_midi, composition_to_canonical_json
-from .musical_analysis import MUSIC21_AVAILABLE, analyze_composition
-
-if TYPE_CHECKING:
-    from pathlib import Path
+import importlib.util
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
+import mido
 
+from .analyze import analyze_midi
+from .iterate import composition_from_midi, composition_to_canonical_json_prefix
+
+# Cheap availability check; music21 itself (slow to import) is only loaded by
+# check_musical_quality, so technical-only runs and --help never pay for it
+MUSIC21_AVAILABLE = importlib.util.find_spec("music21") is not None
+
+# Interned severity and category names; QualityIssue interns its own values too,
+# so the comparisons in calculate_scores mostly short-circuit on identity
+SEV_ERROR = sys.intern("error")
+SEV_WARNING = sys.intern("warning")
+SEV_INFO = sys.intern("info")
+CAT_TECHNICAL = sys.intern("technical")
+CAT_MUSICAL = sys.intern("musical")
+CAT_STRUCTURE = sys.intern("structure")
+
+# Score penalty per (error, warning) in each category, and each category's weight
+# in the overall score; see QualityReport.calculate_scores
+_SCORE_PENALTIES = {
+    CAT_TECHNICAL: (0.3, 0.1),
+    CAT_MUSICAL: (0.2, 0.05),
+    CAT_STRUCTURE: (0.25, 0.1),
+}
+_CATEGORY_WEIGHTS = {CAT_TECHNICAL: 0.4, CAT_MUSICAL: 0.4, CAT_STRUCTURE: 0.2}
+
+
+@dataclass(slots=True, eq=False)
 class QualityIssue:
     """Represents a quality issue found in a MIDI file."""
 
-    def __init__(
-        self,
-        severity: str,  # "error", "warning", "info"
-        category: str,  # "technical", "musical", "structure"
-        message: str,
-        details: dict[str, Any] | None = None,
-    ):
-        self.severity = severity
-        self.category = category
-        self.message = message
-        self.details = details or {}
+    severity: str  # "error", "warning", "info"
+    category: str  # "technical", "musical", "structure"
+    message: str
+    details: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        self.severity = sys.intern(self.severity)
+        self.category = sys.intern(self.category)
+        if self.details is None:
+            self.details = {}
 
     def __repr__(self) -> str:
         return f"QualityIssue({self.severity}, {self.category}, {self.message})"
 
 
+@dataclass(slots=True, eq=False)
 class QualityReport:
     """Quality assessment report for a MIDI file."""
 
-    def __init__(self, file_path: Path):
-        self.file_path = file_path
-        self.issues: list[QualityIssue] = []
-        self.scores: dict[str, float] = {}  # Category scores (0-1)
-        self.overall_score: float = 0.0
-        self.summary: dict[str, Any] = {}
-        self.ai_assessment: str | None = None
+    file_path: Path
+    issues: list[QualityIssue] = field(default_factory=list)
+    scores: dict[str, float] = field(default_factory=dict)  # Category scores (0-1)
+    overall_score: float = 0.0
+    summary: dict[str, Any] = field(default_factory=dict)
+    ai_assessment: str | None = None
+    # Categories whose checks were not run; they get no score and no weight
+    skipped_categories: list[str] = field(default_factory=list)
 
     def add_issue(self, issue: QualityIssue) -> None:
         """Add a quality issue."""
         self.issues.append(issue)
 
+    def category_counts(self) -> Counter[str]:
+        """Number of issues in each category, of any severity."""
+        return Counter(i.category for i in self.issues)
+
     def calculate_scores(self) -> None:
         """
         Calculate quality scores based on issues.
@@ -64,42 +96,30 @@ class QualityReport:
         - Overall score: Weighted average (40% technical, 40% musical, 20% structure)
 
         Note: "info" severity issues don't affect scores - they're informational only.
+        Skipped categories are left out, and the remaining weights are renormalized.
         """
-        # Technical score (penalize errors and warnings)
-        technical_errors = sum(
-            1 for i in self.issues if i.category == "technical" and i.severity == "error"
-        )
-        technical_warnings = sum(
-            1 for i in self.issues if i.category == "technical" and i.severity == "warning"
-        )
-        technical_score = max(0.0, 1.0 - (technical_errors * 0.3) - (technical_warnings * 0.1))
-
-        # Musical score
-        musical_errors = sum(
-            1 for i in self.issues if i.category == "musical" and i.severity == "error"
-        )
-        musical_warnings = sum(
-            1 for i in self.issues if i.category == "musical" and i.severity == "warning"
-        )
-        musical_score = max(0.0, 1.0 - (musical_errors * 0.2) - (musical_warnings * 0.05))
-
-        # Structure score
-        structure_errors = sum(
-            1 for i in self.issues if i.category == "structure" and i.severity == "error"
-        )
-        structure_warnings = sum(
-            1 for i in self.issues if i.category == "structure" and i.severity == "warning"
-        )
-        structure_score = max(0.0, 1.0 - (structure_errors * 0.25) - (structure_warnings * 0.1))
+        # Count issues per (category, severity) in a single pass
+        counts = Counter((i.category, i.severity) for i in self.issues)
 
         self.scores = {
-            "technical": technical_score,
-            "musical": musical_score,
-            "structure": structure_score,
+            category: max(
+                0.0,
+                1.0
+                - counts[category, SEV_ERROR] * error_penalty
+                - counts[category, SEV_WARNING] * warning_penalty,
+            )
+            for category, (error_penalty, warning_penalty) in _SCORE_PENALTIES.items()
+            if category not in self.skipped_categories
         }
 
-        # Overall score (weighted average)
-        self.overall_score = technical_score * 0.4 + musical_score * 0.4 + structure_score * 0.2
+        # Overall score (weighted average over the assessed categories)
+        total_weight = sum(_CATEGORY_WEIGHTS[category] for category in self.scores)
+        self.overall_score = (
+            sum(self.scores[category] * _CATEGORY_WEIGHTS[category] for category in self.scores)
+            / total_weight
+            if total_weight
+            else 0.0
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert report to dictionary."""
@@ -119,8 +139,25 @@ class QualityReport:
             ],
             "summary": self.summary,
             "ai_assessment": self.ai_assessment,
+            "skipped_categories": list(self.skipped_categories),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QualityReport:
+        """Rebuild a report from `to_dict` output; scores are recalculated from the issues."""
+        report = cls(
+            Path(data["file"]),
+            issues=[
+                QualityIssue(i["severity"], i["category"], i["message"], i.get("details"))
+                for i in data.get("issues", [])
+            ],
+            summary=dict(data.get("summary") or {}),
+            ai_assessment=data.get("ai_assessment"),
+            skipped_categories=list(data.get("skipped_categories") or []),
+        )
+        report.calculate_scores()
+        return report
+
 
 def check_technical_quality(midi_analysis: Any, report: QualityReport) -> None:
     """Check technical quality of MIDI file."""
@@ -266,7 +303,9 @@ def check_musical_quality(
         report: Quality report to update
         musical_analysis: Optional pre-computed musical analysis (avoids recomputation)
     """
-    if not MUSIC21_AVAILABLE:
+    if MUSIC21_AVAILABLE:
+        from . import musical_analysis as music
+    if not MUSIC21_AVAILABLE or not music.MUSIC21_AVAILABLE:
         report.add_issue(
             QualityIssue(
                 "warning",
@@ -279,7 +318,7 @@ def check_musical_quality(
     try:
         # Use pre-computed analysis if provided, otherwise compute it
         if musical_analysis is None:
-            analysis = analyze_composition(composition)
+            analysis = music.analyze_composition(composition)
         else:
             analysis = musical_analysis
 
@@ -400,8 +439,13 @@ def get_ai_assessment(
     report: QualityReport,
     provider: str = "gemini",
     model: str | None = None,
+    client: Any | None = None,
 ) -> None:
-    """Get AI assessment of musical quality."""
+    """Get AI assessment of musical quality.
+
+    Pass a client from `ai_providers.create_client` to reuse it (and its
+    connections) across assessments.
+    """
     try:
         from .ai_providers import GeminiError, OllamaError, OpenRouterError, generate_text_unified
 
@@ -411,17 +455,18 @@ def get_ai_assessment(
 
             model = get_default_model(provider)
 
-        comp_json = composition_to_canonical_json(composition)
+        comp_json = composition_to_canonical_json_prefix(composition, 2000)
+        category_counts = report.category_counts()
 
         prompt = f"""You are a music expert evaluating a MIDI file for quality and suitability as a reference example.
 
 The composition JSON is:
-{comp_json[:2000]}...
+{comp_json}...
 
 Quality issues found so far:
-- Technical: {len([i for i in report.issues if i.category == "technical"])} issues
-- Musical: {len([i for i in report.issues if i.category == "musical"])} issues
-- Structure: {len([i for i in report.issues if i.category == "structure"])} issues
+- Technical: {category_counts[CAT_TECHNICAL]} issues
+- Musical: {category_counts[CAT_MUSICAL]} issues
+- Structure: {category_counts[CAT_STRUCTURE]} issues
 
 Please provide a brief assessment (2-3 sentences) of:
 1. Overall musical quality and coherence
@@ -431,7 +476,7 @@ Please provide a brief assessment (2-3 sentences) of:
 Be concise and specific."""
 
         response = generate_text_unified(
-            provider=provider, model=model, prompt=prompt, verbose=False
+            provider=provider, model=model, prompt=prompt, verbose=False, client=client
         )
         report.ai_assessment = response.strip()
 
@@ -445,12 +490,104 @@ Be concise and specific."""
         )
 
 
+# Start of one assessment in a batched AI response: "[3] ..." at the start of a line
+_BATCH_ITEM = re.compile(r"^\s*\[(\d+)\]\s*", re.MULTILINE)
+
+
+def get_ai_assessments(
+    items: list[tuple[Any, QualityReport]],
+    provider: str = "gemini",
+    model: str | None = None,
+    client: Any | None = None,
+) -> None:
+    """Get AI assessments for several files with a single request.
+
+    `items` pairs each composition with its report. The response is split per
+    file and assigned to each report's `ai_assessment`; a report whose
+    assessment is missing gets the same warning as a failed single assessment.
+    Scores are not recalculated here.
+    """
+    if not items:
+        return
+    try:
+        from .ai_providers import generate_text_unified
+
+        # Set default model if not provided
+        if model is None:
+            from .ai_providers import get_default_model
+
+            model = get_default_model(provider)
+
+        sections = []
+        for number, (composition, report) in enumerate(items, start=1):
+            comp_json = composition_to_canonical_json_prefix(composition, 2000)
+            category_counts = report.category_counts()
+            sections.append(f"""File [{number}]: {report.file_path.name}
+
+The composition JSON is:
+{comp_json}...
+
+Quality issues found so far:
+- Technical: {category_counts[CAT_TECHNICAL]} issues
+- Musical: {category_counts[CAT_MUSICAL]} issues
+- Structure: {category_counts[CAT_STRUCTURE]} issues""")
+
+        files_text = "\n\n---\n\n".join(sections)
+        prompt = f"""You are a music expert evaluating {len(items)} MIDI files for quality and suitability as reference examples.
+
+{files_text}
+
+For each file, provide a brief assessment (2-3 sentences) of:
+1. Overall musical quality and coherence
+2. Whether this would be a good reference example
+3. Any notable strengths or weaknesses
+
+Start each assessment on a new line with its file number in brackets, e.g. "[1] ...", and give one assessment per file in order.
+
+Be concise and specific."""
+
+        response = generate_text_unified(
+            provider=provider, model=model, prompt=prompt, verbose=False, client=client
+        )
+
+        # re.split yields [preamble, number, text, number, text, ...]
+        parts = _BATCH_ITEM.split(response)
+        assessments = {
+            int(n): text.strip() for n, text in zip(parts[1::2], parts[2::2], strict=True)
+        }
+        for number, (_, report) in enumerate(items, start=1):
+            assessment = assessments.get(number)
+            if assessment:
+                report.ai_assessment = assessment
+            else:
+                report.add_issue(
+                    QualityIssue(
+                        "warning",
+                        "technical",
+                        "AI assessment failed: no assessment for this file in the batch response",
+                    )
+                )
+
+    except Exception as e:
+        for _, report in items:
+            report.add_issue(
+                QualityIssue(
+                    "warning", "technical", f"AI assessment failed: {e}", {"error": str(e)}
+                )
+            )
+
+
 def check_midi_file(
     file_path: Path,
     provider: str = "gemini",
     model: str | None = None,
     composition: Any | None = None,
     musical_analysis: Any | None = None,
+    *,
+    client: Any | None = None,
+    skip_musical: bool = False,
+    use_ai: bool = True,
+    midi: mido.MidiFile | None = None,
 ) -> QualityReport:
     """Check quality of a single MIDI file.
 
@@ -460,12 +597,24 @@ def check_midi_file(
         model: AI model name
         composition: Optional pre-loaded composition object (avoids reloading)
         musical_analysis: Optional pre-computed musical analysis (avoids recomputation)
+        client: Optional provider client from `ai_providers.create_client`, shared
+            across files so each AI assessment reuses its connections
+        skip_musical: Skip the music21-based musical checks (technical/structure only);
+            the musical category is then left out of the scores
+        use_ai: Request an AI assessment; callers that request it separately (such as
+            batched assessments) pass False
+        midi: Optional already-parsed MIDI file (avoids parsing it again)
     """
     report = QualityReport(file_path)
 
     try:
+        # Parse the file once (or reuse the caller's parse); analysis and
+        # composition import both read this copy
+        if midi is None:
+            midi = mido.MidiFile(file_path)
+
         # Basic MIDI analysis
-        midi_analysis = analyze_midi(file_path)
+        midi_analysis = analyze_midi(file_path, midi)
         report.summary["duration_beats"] = midi_analysis.duration_beats
         report.summary["duration_seconds"] = midi_analysis.duration_seconds
         report.summary["tracks"] = len(midi_analysis.tracks)
@@ -483,15 +632,22 @@ def check_midi_file(
         # Structure checks
         check_structure_quality(midi_analysis, report)
 
+        if skip_musical:
+            report.skipped_categories.append(CAT_MUSICAL)
+            report.add_issue(QualityIssue("info", "musical", "Musical checks skipped"))
+
         # Convert to composition for musical analysis (use provided if available)
+        needs_composition = use_ai or (not skip_musical and MUSIC21_AVAILABLE)
         try:
-            if composition is None:
-                composition = composition_from_midi(file_path)
-            # Pass pre-computed analysis to avoid recomputation
-            check_musical_quality(composition, report, musical_analysis=musical_analysis)
+            if composition is None and needs_composition:
+                composition = composition_from_midi(file_path, midi=midi)
+            if not skip_musical:
+                # Pass pre-computed analysis to avoid recomputation
+                check_musical_quality(composition, report, musical_analysis=musical_analysis)
 
             # AI assessment
-            get_ai_assessment(composition, report, provider, model)
+            if use_ai:
+                get_ai_assessment(composition, report, provider, model, client=client)
         except Exception as e:
             report.add_issue(
                 QualityIssue(
@@ -527,9 +683,13 @@ def print_report(report: QualityReport, verbose: bool = False) -> None:
         "✅" if report.overall_score >= 0.8 else "⚠️" if report.overall_score >= 0.6 else "❌"
     )
     print(f"\n{score_emoji} Overall Score: {report.overall_score:.2%}")
-    print(f"   Technical: {report.scores.get('technical', 0):.2%}")
-    print(f"   Musical:   {report.scores.get('musical', 0):.2%}")
-    print(f"   Structure: {report.scores.get('structure', 0):.2%}")
+    for label, category in (
+        ("Technical:", CAT_TECHNICAL),
+        ("Musical:  ", CAT_MUSICAL),
+        ("Structure:", CAT_STRUCTURE),
+    ):
+        score = report.scores.get(category)
+        print(f"   {label} {'skipped' if score is None else f'{score:.2%}'}")
 
     # Summary
     if report.summary:
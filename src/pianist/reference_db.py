@@ -135,18 +135,20 @@ class ReferenceDatabase:
         conn.commit()
         conn.close()
 
-    def add_reference(self, reference: MusicalReference) -> None:
-        """
-        Add a musical reference to the database.
+    _INSERT_SQL = """
+        INSERT OR REPLACE INTO musical_references
+        (id, title, description, style, form, techniques, composition_json, metadata,
+         detected_key, tempo_bpm, duration_beats, quality_score, technical_score,
+         musical_score, structure_score, motif_count, phrase_count, chord_count,
+         harmonic_progression, time_signature, bars)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-        Args:
-            reference: The musical reference to add
-        """
+    @staticmethod
+    def _reference_row(reference: MusicalReference) -> tuple[Any, ...]:
+        """Build the INSERT parameter tuple for a reference."""
         from .iterate import composition_to_canonical_json
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         composition_json = composition_to_canonical_json(reference.composition)
         techniques_json = json.dumps(reference.techniques) if reference.techniques else None
         metadata_json = json.dumps(reference.metadata) if reference.metadata else None
@@ -156,42 +158,60 @@ class ReferenceDatabase:
         if harmonic_prog:
             harmonic_prog = " ".join(harmonic_prog.split()[:10])
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO musical_references
-            (id, title, description, style, form, techniques, composition_json, metadata,
-             detected_key, tempo_bpm, duration_beats, quality_score, technical_score,
-             musical_score, structure_score, motif_count, phrase_count, chord_count,
-             harmonic_progression, time_signature, bars)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                reference.id,
-                reference.title,
-                reference.description,
-                reference.style,
-                reference.form,
-                techniques_json,
-                composition_json,
-                metadata_json,
-                reference.detected_key,
-                reference.tempo_bpm,
-                reference.duration_beats,
-                reference.quality_score,
-                reference.technical_score,
-                reference.musical_score,
-                reference.structure_score,
-                reference.motif_count,
-                reference.phrase_count,
-                reference.chord_count,
-                harmonic_prog,
-                reference.time_signature,
-                reference.bars,
-            ),
+        return (
+            reference.id,
+            reference.title,
+            reference.description,
+            reference.style,
+            reference.form,
+            techniques_json,
+            composition_json,
+            metadata_json,
+            reference.detected_key,
+            reference.tempo_bpm,
+            reference.duration_beats,
+            reference.quality_score,
+            reference.technical_score,
+            reference.musical_score,
+            reference.structure_score,
+            reference.motif_count,
+            reference.phrase_count,
+            reference.chord_count,
+            harmonic_prog,
+            reference.time_signature,
+            reference.bars,
         )
 
-        conn.commit()
-        conn.close()
+    def add_reference(self, reference: MusicalReference) -> None:
+        """
+        Add a musical reference to the database.
+
+        Args:
+            reference: The musical reference to add
+        """
+        self.add_references_bulk([reference])
+
+    def add_references_bulk(self, references: list[MusicalReference]) -> None:
+        """
+        Add many musical references in a single transaction.
+
+        Existing references with the same ID are replaced. Either all
+        references are written or, if any insert fails, none are.
+
+        Args:
+            references: The musical references to add
+        """
+        if not references:
+            return
+
+        rows = [self._reference_row(reference) for reference in references]
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(self._INSERT_SQL, rows)
+        finally:
+            conn.close()
 
     def get_reference(self, reference_id: str) -> MusicalReference | None:
         """
@@ -16,6 +16,7 @@ import pytest
 from pianist.ai_providers import (
     GeminiError,
     OllamaError,
+    create_client,
     generate_text_ollama,
     generate_text_unified,
 )
@@ -120,6 +121,28 @@ def test_generate_text_ollama_success(monkeypatch) -> None:
         assert call_args[1]["timeout"] == 3600
 
 
+def test_generate_text_ollama_uses_session(monkeypatch) -> None:
+    """Test that a provided session is used instead of module-level requests.post."""
+    monkeypatch.setenv("OLLAMA_URL", "http://localhost:11434")
+
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"response": "From session"}
+    mock_response.raise_for_status = MagicMock()
+
+    mock_requests = _create_mock_requests()
+    session = MagicMock()
+    session.post.return_value = mock_response
+
+    with patch.dict("sys.modules", {"requests": mock_requests}):
+        result = generate_text_ollama(
+            model="test-model", prompt="test", verbose=False, session=session
+        )
+
+        assert result == "From session"
+        session.post.assert_called_once()
+        mock_requests.post.assert_not_called()
+
+
 def test_generate_text_ollama_custom_url(monkeypatch) -> None:
     """Test that custom OLLAMA_URL is used."""
     custom_url = "http://custom-host:8080"
@@ -205,6 +228,51 @@ def test_generate_text_unified_gemini(monkeypatch) -> None:
         mock_genai.Client.assert_called_once()
 
 
+def test_generate_text_unified_gemini_reuses_client(monkeypatch) -> None:
+    """Test that a provided Gemini client is used instead of creating a new one."""
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+    mock_google = MagicMock()
+    mock_genai = MagicMock()
+    mock_google.genai = mock_genai
+
+    mock_chunk = MagicMock()
+    mock_chunk.text = "Shared client response"
+    client = MagicMock()
+    client.models.generate_content_stream = MagicMock(return_value=iter([mock_chunk]))
+
+    with patch.dict("sys.modules", {"google": mock_google, "google.genai": mock_genai}):
+        result = generate_text_unified(
+            provider="gemini", model="gemini-flash-latest", prompt="test", client=client
+        )
+
+        assert result == "Shared client response"
+        mock_genai.Client.assert_not_called()
+
+
+def test_create_client(monkeypatch) -> None:
+    """Test creating reusable provider clients."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+
+    # Without credentials there is no Gemini client; generate_text reports the error
+    assert create_client("gemini") is None
+
+    mock_requests = _create_mock_requests()
+    with patch.dict(
+        "sys.modules", {"requests": mock_requests, "requests.adapters": mock_requests.adapters}
+    ):
+        client = create_client("ollama", pool_size=4)
+        assert client is mock_requests.Session.return_value
+        mock_requests.adapters.HTTPAdapter.assert_called_once_with(
+            pool_connections=4, pool_maxsize=4
+        )
+
+    with pytest.raises(ValueError, match="Unsupported provider"):
+        create_client("invalid")
+
+
 def test_generate_text_unified_ollama(monkeypatch) -> None:
     """Test unified interface routes to Ollama correctly."""
     monkeypatch.setenv("OLLAMA_URL", "http://localhost:11434")
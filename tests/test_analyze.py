@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 import mido
 
-from pianist.analyze import analysis_prompt_template, analyze_midi
+from pianist.analyze import analysis_prompt_template, analyze_midi, find_midi_files
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -84,3 +84,29 @@ def test_analysis_prompt_template_contains_key_fields(tmp_path: Path) -> None:
     assert "Output MUST be valid JSON only" in prompt
     assert "REFERENCE ANALYSIS" in prompt
     assert "Write a calm 32-bar nocturne." in prompt
+
+
+def test_analyze_midi_reuses_parsed_file(tmp_path: Path) -> None:
+    midi_path = tmp_path / "in.mid"
+    _write_test_midi(midi_path)
+
+    parsed = mido.MidiFile(midi_path)
+    assert analyze_midi(midi_path, parsed) == analyze_midi(midi_path)
+
+
+def test_find_midi_files_includes_midi_and_subdirectory_patterns(tmp_path: Path) -> None:
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (tmp_path / "b.mid").write_bytes(b"xx")
+    (tmp_path / "c.midi").write_bytes(b"xxx")
+    (tmp_path / "a.txt").write_bytes(b"")
+    (sub / "a.mid").write_bytes(b"x")
+
+    assert find_midi_files(tmp_path) == [tmp_path / "b.mid", tmp_path / "c.midi"]
+    assert find_midi_files(tmp_path, "c.*") == [tmp_path / "c.midi"]
+    assert find_midi_files(tmp_path, "sub/*.mid") == [tmp_path / "c.midi", sub / "a.mid"]
+    assert find_midi_files(tmp_path, "**/*.mid", by_size=True) == [
+        sub / "a.mid",
+        tmp_path / "b.mid",
+        tmp_path / "c.midi",
+    ]
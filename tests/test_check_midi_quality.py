@@ -0,0 +1,48 @@
+"""Tests for check_midi_quality.py script."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+project_root = Path(__file__).parent.parent
+scripts_dir = project_root / "scripts"
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
+
+# Import from scripts directory (added to path above)
+# Type checker may not resolve this, but it works at runtime
+if True:  # Type checker workaround
+    from check_midi_quality import cache_report, cached_report  # type: ignore[import]
+
+from pianist.quality import QualityReport
+
+
+def test_cached_report_requires_same_provider_and_model(tmp_path: Path) -> None:
+    """Test that switching the AI provider or model invalidates a cached report."""
+    midi_file = tmp_path / "test.mid"
+    midi_file.write_bytes(b"MThd")
+    report = QualityReport(midi_file, ai_assessment="Fine.")
+    report.calculate_scores()
+
+    cache: dict = {}
+    cache_report(cache, report, skip_musical=False, provider="gemini", model="model-a")
+
+    hit = cached_report(cache, midi_file, skip_musical=False, provider="gemini", model="model-a")
+    assert hit is not None
+    assert hit.ai_assessment == "Fine."
+    assert (
+        cached_report(cache, midi_file, skip_musical=False, provider="ollama", model="model-a")
+        is None
+    )
+    assert (
+        cached_report(cache, midi_file, skip_musical=False, provider="gemini", model="model-b")
+        is None
+    )
+    assert (
+        cached_report(
+            cache, midi_file, skip_musical=False, provider="gemini", model="model-a", use_ai=False
+        )
+        is None
+    )
@@ -6,7 +6,12 @@ from typing import TYPE_CHECKING
 
 import mido
 
-from pianist.iterate import composition_from_midi, transpose_composition
+from pianist.iterate import (
+    composition_from_midi,
+    composition_to_canonical_json,
+    composition_to_canonical_json_prefix,
+    transpose_composition,
+)
 from pianist.schema import NoteEvent, PedalEvent, TempoEvent
 
 if TYPE_CHECKING:
@@ -77,3 +82,24 @@ def test_midi_import_to_composition(tmp_path: Path) -> None:
     tr2 = comp2.tracks[0]
     notes2 = [e for e in tr2.events if isinstance(e, NoteEvent)]
     assert notes2[0].pitches == [62, 66]
+
+
+def test_midi_import_from_bytes(tmp_path: Path) -> None:
+    """Test that MIDI import accepts already-read file bytes."""
+    midi_path = tmp_path / "in.mid"
+    _write_test_midi(midi_path)
+
+    assert composition_from_midi(midi_path, midi_path.read_bytes()) == composition_from_midi(
+        midi_path
+    )
+
+
+def test_canonical_json_prefix_matches_full_json(tmp_path: Path) -> None:
+    """Test that the canonical JSON prefix is a slice of the full serialization."""
+    midi_path = tmp_path / "in.mid"
+    _write_test_midi(midi_path)
+    comp = composition_from_midi(midi_path)
+
+    full = composition_to_canonical_json(comp)
+    for max_chars in (0, 1, 50, len(full) - 1, len(full), len(full) + 10):
+        assert composition_to_canonical_json_prefix(comp, max_chars) == full[:max_chars]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from pianist.parser import parse_composition_from_text
+from pianist.parser import parse_composition_from_bytes, parse_composition_from_text
 
 
 def test_parser_accepts_fenced_json() -> None:
@@ -93,3 +93,17 @@ def test_parser_does_not_convert_legitimate_beats() -> None:
     assert events[0].duration == 1.0
     assert events[1].start == 4.0
     assert events[1].duration == 2.0
+
+
+def test_parse_composition_from_bytes() -> None:
+    data = (
+        b'{"title": "x", "bpm": 120, "time_signature": {"numerator": 4, "denominator": 4},'
+        b' "tracks": [{"events": [{"type": "note", "start": 0, "duration": 1,'
+        b' "pitches": ["C4"]}]}]}'
+    )
+    comp = parse_composition_from_bytes(data)
+    assert comp.title == "x"
+
+    # Non-strict JSON still goes through the lenient text parser
+    comp = parse_composition_from_bytes(b"```json\n" + data[:-1] + b",}\n```")
+    assert comp.title == "x"
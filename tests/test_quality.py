@@ -9,9 +9,11 @@ import pytest
 from pianist.quality import (
     QualityIssue,
     QualityReport,
+    check_midi_file,
     check_musical_quality,
     check_structure_quality,
     check_technical_quality,
+    get_ai_assessments,
 )
 
 
@@ -147,6 +149,130 @@ def test_check_musical_quality(tmp_path: Path) -> None:
     assert report.overall_score >= 0.0
 
 
+def test_check_midi_file_skips_composition_when_unneeded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that technical-only checks don't convert the MIDI to a composition."""
+    import mido
+
+    midi_file = tmp_path / "test.mid"
+    mid = mido.MidiFile(ticks_per_beat=480)
+    track = mido.MidiTrack()
+    mid.tracks.append(track)
+    track.append(mido.Message("note_on", note=60, velocity=64, channel=0, time=0))
+    track.append(mido.Message("note_off", note=60, velocity=0, channel=0, time=480))
+    track.append(mido.MetaMessage("end_of_track", time=0))
+    mid.save(midi_file)
+
+    def fail_conversion(*args, **kwargs):
+        raise AssertionError("composition_from_midi should not be called")
+
+    monkeypatch.setattr("pianist.quality.composition_from_midi", fail_conversion)
+
+    report = check_midi_file(midi_file, skip_musical=True, use_ai=False)
+
+    assert report.ai_assessment is None
+    assert any(i.message == "Musical checks skipped" for i in report.issues)
+    assert not any("Failed" in i.message for i in report.issues)
+
+
+def test_check_midi_file_uses_caller_parse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a MidiFile passed in is checked without parsing the file again."""
+    import mido
+
+    mid = mido.MidiFile(ticks_per_beat=480)
+    track = mido.MidiTrack()
+    mid.tracks.append(track)
+    track.append(mido.Message("note_on", note=60, velocity=64, channel=0, time=0))
+    track.append(mido.Message("note_off", note=60, velocity=0, channel=0, time=480))
+    track.append(mido.MetaMessage("end_of_track", time=0))
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("the MIDI file should not be parsed again")
+
+    monkeypatch.setattr("pianist.quality.mido.MidiFile", fail_parse)
+
+    # The path doesn't exist; only the parsed file is read
+    report = check_midi_file(tmp_path / "test.mid", skip_musical=True, use_ai=False, midi=mid)
+
+    assert report.summary["tracks"] == 1
+    assert not any("Failed" in i.message for i in report.issues)
+
+
+def test_skip_musical_leaves_passing_score_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that skipping musical checks that would pass doesn't change the overall score."""
+    import mido
+
+    # 64 beats of scale notes with varied velocities: no technical or structure issues
+    midi_file = tmp_path / "test.mid"
+    mid = mido.MidiFile(ticks_per_beat=480)
+    track = mido.MidiTrack()
+    mid.tracks.append(track)
+    track.append(mido.MetaMessage("set_tempo", tempo=500000, time=0))
+    for i in range(64):
+        note = (60, 62, 64, 65, 67, 69, 71, 72)[i % 8]
+        track.append(mido.Message("note_on", note=note, velocity=64 + (i % 5) * 6, time=0))
+        track.append(mido.Message("note_off", note=note, velocity=0, time=480))
+    track.append(mido.MetaMessage("end_of_track", time=0))
+    mid.save(midi_file)
+
+    def no_musical_issues(*_args, **_kwargs):
+        """Musical checks that find nothing, as they would for a musically sound file."""
+
+    monkeypatch.setattr("pianist.quality.check_musical_quality", no_musical_issues)
+    monkeypatch.setattr("pianist.quality.MUSIC21_AVAILABLE", True)
+
+    checked = check_midi_file(midi_file, use_ai=False)
+    skipped = check_midi_file(midi_file, skip_musical=True, use_ai=False)
+
+    assert checked.scores["musical"] == 1.0
+    assert "musical" not in skipped.scores
+    assert skipped.overall_score == pytest.approx(checked.overall_score)
+    assert QualityReport.from_dict(skipped.to_dict()).overall_score == pytest.approx(
+        skipped.overall_score
+    )
+
+
+def test_get_ai_assessments_splits_batched_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that one batched AI response is split across the reports."""
+    from pianist.schema import Composition
+
+    composition = Composition.model_validate({"title": "Test", "tracks": [{"events": []}]})
+    reports = [QualityReport(Path(f"{name}.mid")) for name in ("a", "b", "c")]
+    prompts: list[str] = []
+
+    def fake_generate(*, prompt: str, **kwargs) -> str:
+        prompts.append(prompt)
+        return "Here you go:\n[1] Solid piece.\n2. Good reference.\n[2] Too short.\n"
+
+    monkeypatch.setattr("pianist.ai_providers.generate_text_unified", fake_generate)
+
+    get_ai_assessments([(composition, r) for r in reports], provider="ollama", model="m")
+
+    assert len(prompts) == 1
+    assert "File [3]: c.mid" in prompts[0]
+    assert reports[0].ai_assessment == "Solid piece.\n2. Good reference."
+    assert reports[1].ai_assessment == "Too short."
+    # Missing from the response: treated like a failed assessment
+    assert reports[2].ai_assessment is None
+    assert any("AI assessment failed" in i.message for i in reports[2].issues)
+
+
+def test_quality_report_round_trips_through_dict() -> None:
+    """Test that a report rebuilt from to_dict output matches the original."""
+    report = QualityReport(Path("test.mid"), summary={"tracks": 1}, ai_assessment="Fine.")
+    report.add_issue(QualityIssue("error", "structure", "Empty track", {"track": 0}))
+    report.add_issue(QualityIssue("warning", "musical", "No motifs"))
+    report.calculate_scores()
+
+    rebuilt = QualityReport.from_dict(report.to_dict())
+
+    assert rebuilt.to_dict() == report.to_dict()
+    assert rebuilt.overall_score == report.overall_score
+
+
 def test_score_calculation() -> None:
     """Test that scores are calculated correctly based on issues."""
     report = QualityReport(Path("test.mid"))
@@ -166,3 +292,21 @@ def test_score_calculation() -> None:
     assert report.scores["structure"] == 1.0
     # Overall should be weighted average
     assert report.overall_score < 1.0
+
+
+def test_scores_follow_issues_modified_directly() -> None:
+    """Test that scores and counts reflect issues added without add_issue."""
+    report = QualityReport(Path("test.mid"))
+    report.add_issue(QualityIssue("error", "technical", "Error 1"))
+    report.issues.append(QualityIssue("error", "structure", "Error 2"))
+    report.issues.extend([QualityIssue("warning", "structure", "Warning 1")])
+
+    report.calculate_scores()
+    assert report.scores["technical"] == pytest.approx(0.7)
+    assert report.scores["structure"] == pytest.approx(0.65)
+    assert report.category_counts()["structure"] == 2
+
+    report.issues = []
+    report.calculate_scores()
+    assert report.overall_score == pytest.approx(1.0)
+    assert not report.category_counts()
@@ -321,6 +321,48 @@ def test_count_references(tmp_path: Path) -> None:
     assert db.count_references() == 3
 
 
+def test_add_references_bulk(tmp_path: Path) -> None:
+    """Test adding many references in one transaction."""
+    db_path = tmp_path / "test.db"
+    db = ReferenceDatabase(db_path)
+
+    comp_json = {
+        "title": "Test",
+        "bpm": 120,
+        "time_signature": {"numerator": 4, "denominator": 4},
+        "ppq": 480,
+        "tracks": [{"events": []}],
+    }
+    comp = parse_composition_from_text(json.dumps(comp_json))
+
+    refs = [
+        MusicalReference(
+            id=f"ref_{i}",
+            title=f"Reference {i}",
+            description="Test",
+            composition=comp,
+            techniques=["sequence"],
+        )
+        for i in range(5)
+    ]
+    db.add_references_bulk(refs)
+    db.add_references_bulk([])
+
+    assert db.count_references() == 5
+    retrieved = db.get_reference("ref_3")
+    assert retrieved is not None
+    assert retrieved.title == "Reference 3"
+    assert retrieved.techniques == ["sequence"]
+
+    # Re-adding an existing ID replaces it
+    refs[0].title = "Replaced"
+    db.add_references_bulk(refs[:1])
+    assert db.count_references() == 5
+    replaced = db.get_reference("ref_0")
+    assert replaced is not None
+    assert replaced.title == "Replaced"
+
+
 def test_find_relevant_references(tmp_path: Path) -> None:
     """Test finding relevant references for a composition."""
     db_path = tmp_path / "test.db"
@@ -6,6 +6,7 @@ import sys
 from pathlib import Path
 
 import mido
+import numpy as np
 import pytest
 
 # Add scripts directory to path
@@ -18,7 +19,10 @@ if str(scripts_dir) not in sys.path:
 # Type checker may not resolve this, but it works at runtime
 if True:  # Type checker workaround
     from review_and_categorize_midi import (  # type: ignore[import]
+        FileMetadata,
+        SimilarityFeatures,
         analyze_file,
+        calculate_similarity,
         extract_info_from_filename,
     )
 
@@ -404,3 +408,68 @@ def test_analyze_file_with_hyphenated_filename(tmp_path: Path, monkeypatch) -> N
     assert metadata.filename == midi_file.name
     assert metadata.suggested_name is not None
     assert len(metadata.suggested_name) > 0
+
+
+def _similarity_metadata(
+    name: str,
+    key: str | None,
+    form: str | None,
+    progression: str | None,
+    duration: float,
+) -> FileMetadata:
+    return FileMetadata(
+        filename=name,
+        filepath=name,
+        quality_score=0.9,
+        quality_issues=0,
+        duration_beats=duration,
+        duration_seconds=duration / 2,
+        bars=duration / 4,
+        tempo_bpm=120.0,
+        time_signature="4/4",
+        key_signature=None,
+        tracks=1,
+        detected_key=key,
+        detected_form=form,
+        motif_count=0,
+        phrase_count=0,
+        chord_count=0,
+        harmonic_progression=progression,
+        suggested_name=name,
+        suggested_id=name,
+        suggested_style=None,
+        suggested_description=None,
+        similar_files=[],
+        similarity_scores={},
+        is_duplicate=False,
+        duplicate_group=None,
+        technical_score=0.9,
+        musical_score=0.9,
+        structure_score=0.9,
+        is_original=False,
+    )
+
+
+def test_similarity_features_match_calculate_similarity() -> None:
+    """Test that the vectorized similarity equals calculate_similarity for every pair."""
+    metadata = [
+        _similarity_metadata("a.mid", "C major", "binary", "I IV V I", 64.0),
+        _similarity_metadata("b.mid", "C minor", "binary", "I IV V I vi ii V I I IV V", 60.0),
+        _similarity_metadata("c.mid", "G", None, "I V", 0.0),
+        _similarity_metadata("d.mid", None, "ternary", None, 120.0),
+        _similarity_metadata("e.mid", "C major", "ternary", "   ", 64.0),
+    ]
+    signatures = [
+        [60, 62, 64, 65, 67, 69],
+        [62, 64, 66, 67, 69],
+        [60, 62, 64],
+        [],
+        [55, 57, 59, 60, 62, 64, 66, 67],
+    ]
+
+    features = SimilarityFeatures(metadata, signatures)
+    for i in range(len(metadata)):
+        similarities = features.against(i, np.arange(len(metadata)))
+        for j in range(len(metadata)):
+            expected = calculate_similarity(metadata[i], metadata[j], signatures[i], signatures[j])
+            assert similarities[j] == expected